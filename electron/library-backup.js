@@ -0,0 +1,392 @@
+const fs = require('fs');
+const path = require('path');
+const crypto = require('crypto');
+const { Transform, Writable } = require('stream');
+const { pipeline } = require('stream/promises');
+const { resolveManagedAudioPath } = require('./managed-paths');
+
+// 资料库备份目录结构：
+//   library-backup.json   清单（会议 id -> 内容哈希、音频哈希，以及源音频的 size/mtime 哈希缓存）
+//   meetings/<sha256>.json 会议记录，按内容寻址
+//   audio/<sha256><ext>    音频文件，按内容寻址
+// 未变化的会议与音频对象已存在于备份目录中，重复备份时只写入新增或变化的部分
+const LIBRARY_BACKUP_FORMAT = 'auto-meeting-recorder-library';
+const LIBRARY_BACKUP_VERSION = 1;
+const LIBRARY_MANIFEST_FILE = 'library-backup.json';
+const MEETING_OBJECTS_DIR = 'meetings';
+const AUDIO_OBJECTS_DIR = 'audio';
+const TEMP_FILE_PREFIX = '.tmp-';
+const OBJECT_FILE_PATTERN = /^[0-9a-f]{64}(\.[a-z0-9]{1,8})?$/;
+const CONTENT_HASH_PATTERN = /^[0-9a-f]{64}$/;
+const AUDIO_EXTENSION_PATTERN = /^\.[a-z0-9]{1,8}$/;
+
+function hashContent(content) {
+  return crypto.createHash('sha256').update(content).digest('hex');
+}
+
+function normalizeAudioExtension(filePath) {
+  const ext = path.extname(filePath || '').toLowerCase();
+  return AUDIO_EXTENSION_PATTERN.test(ext) ? ext : '';
+}
+
+function getAudioObjectName(entry) {
+  return `${entry.hash}${entry.ext || ''}`;
+}
+
+function createTempPath(dir) {
+  return path.join(dir, `${TEMP_FILE_PREFIX}${process.pid}-${crypto.randomBytes(6).toString('hex')}`);
+}
+
+async function pathExists(targetPath) {
+  try {
+    await fs.promises.access(targetPath);
+    return true;
+  } catch {
+    return false;
+  }
+}
+
+// 先写临时文件再 rename，避免中断时留下半个对象或损坏的清单
+async function writeFileAtomic(targetPath, content) {
+  const tempPath = createTempPath(path.dirname(targetPath));
+  await fs.promises.writeFile(tempPath, content);
+  await fs.promises.rename(tempPath, targetPath);
+}
+
+function readLibraryManifest(backupDir) {
+  const manifestPath = path.join(backupDir, LIBRARY_MANIFEST_FILE);
+  if (!fs.existsSync(manifestPath)) {
+    return null;
+  }
+
+  const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+  if (!manifest || manifest.format !== LIBRARY_BACKUP_FORMAT) {
+    throw new Error('Not a meeting library backup');
+  }
+  if (manifest.version !== LIBRARY_BACKUP_VERSION) {
+    throw new Error(`Unsupported library backup version: ${manifest.version}`);
+  }
+
+  return manifest;
+}
+
+function createLibraryBackupSession(backupDir, audioDir) {
+  const previous = readLibraryManifest(backupDir);
+
+  fs.mkdirSync(path.join(backupDir, MEETING_OBJECTS_DIR), { recursive: true });
+  fs.mkdirSync(path.join(backupDir, AUDIO_OBJECTS_DIR), { recursive: true });
+
+  return {
+    backupDir,
+    audioDir,
+    previous,
+    manifest: {
+      format: LIBRARY_BACKUP_FORMAT,
+      version: LIBRARY_BACKUP_VERSION,
+      createdAt: previous ? previous.createdAt : new Date().toISOString(),
+      updatedAt: null,
+      meetings: {},
+      audioSources: {}
+    },
+    stats: {
+      meetings: 0,
+      meetingsWritten: 0,
+      audioFiles: 0,
+      audioWritten: 0,
+      audioMissing: 0,
+      audioSkipped: 0,
+      bytesWritten: 0,
+      objectsPruned: 0
+    }
+  };
+}
+
+async function hashFile(filePath) {
+  const hash = crypto.createHash('sha256');
+
+  await pipeline(
+    fs.createReadStream(filePath),
+    new Writable({
+      write(chunk, encoding, callback) {
+        hash.update(chunk);
+        callback();
+      }
+    })
+  );
+
+  return hash.digest('hex');
+}
+
+// 边读边算哈希边写入临时文件，内存占用只取决于流的缓冲区大小
+async function copyAndHashFile(sourcePath, targetPath) {
+  const hash = crypto.createHash('sha256');
+  let size = 0;
+
+  await pipeline(
+    fs.createReadStream(sourcePath),
+    new Transform({
+      transform(chunk, encoding, callback) {
+        hash.update(chunk);
+        size += chunk.length;
+        callback(null, chunk);
+      }
+    }),
+    fs.createWriteStream(targetPath)
+  );
+
+  return { hash: hash.digest('hex'), size };
+}
+
+async function backupAudioFile(session, sourcePath) {
+  const sourceKey = path.relative(session.audioDir, sourcePath).split(path.sep).join('/');
+  const sessionEntry = session.manifest.audioSources[sourceKey];
+  if (sessionEntry) {
+    return sessionEntry;
+  }
+
+  const audioObjectsDir = path.join(session.backupDir, AUDIO_OBJECTS_DIR);
+  const stat = await fs.promises.stat(sourcePath);
+  const cached = session.previous && session.previous.audioSources
+    ? session.previous.audioSources[sourceKey]
+    : null;
+
+  // 文件大小与修改时间都没变时沿用上次的哈希，重复备份不需要重新读取音频
+  if (cached && cached.size === stat.size && cached.mtimeMs === stat.mtimeMs &&
+      await pathExists(path.join(audioObjectsDir, getAudioObjectName(cached)))) {
+    session.manifest.audioSources[sourceKey] = cached;
+    session.stats.audioFiles++;
+    return cached;
+  }
+
+  const tempPath = createTempPath(audioObjectsDir);
+  const { hash, size } = await copyAndHashFile(sourcePath, tempPath);
+  const entry = {
+    hash,
+    ext: normalizeAudioExtension(sourcePath),
+    name: path.basename(sourcePath),
+    size,
+    mtimeMs: stat.mtimeMs
+  };
+  const objectPath = path.join(audioObjectsDir, getAudioObjectName(entry));
+
+  if (await pathExists(objectPath)) {
+    await fs.promises.unlink(tempPath);
+  } else {
+    await fs.promises.rename(tempPath, objectPath);
+    session.stats.audioWritten++;
+    session.stats.bytesWritten += size;
+  }
+
+  session.manifest.audioSources[sourceKey] = entry;
+  session.stats.audioFiles++;
+  return entry;
+}
+
+async function backupMeetingRecord(session, meeting) {
+  if (!meeting || meeting.id === undefined || meeting.id === null) {
+    throw new Error('Invalid meeting record');
+  }
+
+  let audio = null;
+  let sourcePath = null;
+  if (meeting.audioFilename) {
+    try {
+      sourcePath = resolveManagedAudioPath(session.audioDir, meeting.audioFilename);
+    } catch {
+      // 记录来自其他 userData 路径或其他机器，音频不在当前音频目录中：只备份会议记录
+      session.stats.audioSkipped++;
+    }
+  }
+
+  if (sourcePath) {
+    if (await pathExists(sourcePath)) {
+      const entry = await backupAudioFile(session, sourcePath);
+      audio = { hash: entry.hash, ext: entry.ext, name: entry.name };
+    } else {
+      session.stats.audioMissing++;
+    }
+  }
+
+  const content = JSON.stringify(meeting);
+  const hash = hashContent(content);
+  const objectPath = path.join(session.backupDir, MEETING_OBJECTS_DIR, `${hash}.json`);
+
+  if (!(await pathExists(objectPath))) {
+    await writeFileAtomic(objectPath, content);
+    session.stats.meetingsWritten++;
+    session.stats.bytesWritten += Buffer.byteLength(content);
+  }
+
+  session.manifest.meetings[String(meeting.id)] = { hash, audio };
+  session.stats.meetings++;
+}
+
+// 清理不再被清单引用的对象（已删除或已变化的会议/音频）以及中断遗留的临时文件
+async function pruneUnreferencedObjects(session) {
+  const referenced = {
+    [MEETING_OBJECTS_DIR]: new Set(Object.values(session.manifest.meetings).map((entry) => `${entry.hash}.json`)),
+    [AUDIO_OBJECTS_DIR]: new Set(Object.values(session.manifest.audioSources).map(getAudioObjectName))
+  };
+
+  for (const [dirName, names] of Object.entries(referenced)) {
+    const dir = path.join(session.backupDir, dirName);
+    const files = await fs.promises.readdir(dir);
+
+    for (const file of files) {
+      const isOwnedFile = file.startsWith(TEMP_FILE_PREFIX) || OBJECT_FILE_PATTERN.test(file);
+      if (isOwnedFile && !names.has(file)) {
+        await fs.promises.unlink(path.join(dir, file));
+        session.stats.objectsPruned++;
+      }
+    }
+  }
+}
+
+async function finishLibraryBackup(session) {
+  session.manifest.updatedAt = new Date().toISOString();
+  await writeFileAtomic(
+    path.join(session.backupDir, LIBRARY_MANIFEST_FILE),
+    JSON.stringify(session.manifest, null, 2)
+  );
+  await pruneUnreferencedObjects(session);
+  return session.stats;
+}
+
+function createLibraryImportSession(backupDir, audioDir) {
+  const manifest = readLibraryManifest(backupDir);
+  if (!manifest) {
+    throw new Error('Library backup manifest not found');
+  }
+
+  fs.mkdirSync(audioDir, { recursive: true });
+
+  return {
+    backupDir,
+    audioDir,
+    entries: Object.values(manifest.meetings || {}),
+    stats: {
+      meetings: 0,
+      audioRestored: 0,
+      audioReused: 0
+    },
+    restoredAudioPaths: []
+  };
+}
+
+// 大小一致时再比较内容哈希，确认本机同名文件就是备份中的音频
+async function isSameAudioContent(targetPath, audio, size) {
+  const stat = await fs.promises.stat(targetPath);
+  return stat.size === size && await hashFile(targetPath) === audio.hash;
+}
+
+async function restoreAudioObject(session, audio) {
+  // 清单内容不可信：哈希与扩展名决定备份目录内的对象路径，必须先校验格式
+  const hasValidExt = !audio.ext || AUDIO_EXTENSION_PATTERN.test(audio.ext);
+  if (typeof audio.hash !== 'string' || !CONTENT_HASH_PATTERN.test(audio.hash) || !hasValidExt) {
+    throw new Error('Invalid audio entry in backup');
+  }
+
+  const objectPath = path.join(session.backupDir, AUDIO_OBJECTS_DIR, getAudioObjectName(audio));
+  const { size } = await fs.promises.stat(objectPath);
+  const name = path.basename(typeof audio.name === 'string' && audio.name ? audio.name : getAudioObjectName(audio));
+  const ext = path.extname(name);
+  const baseName = path.basename(name, ext);
+
+  // 同名但内容不同的文件依次改用哈希前缀、完整哈希命名，避免覆盖本机已有录音；
+  // 以完整哈希命名的文件内容不符时只可能是损坏的副本，直接覆盖
+  const candidateNames = [
+    name,
+    `${baseName}_${audio.hash.slice(0, 8)}${ext}`,
+    `${baseName}_${audio.hash}${ext}`
+  ];
+  let targetPath = null;
+
+  for (const candidateName of candidateNames) {
+    targetPath = resolveManagedAudioPath(session.audioDir, candidateName);
+    if (!(await pathExists(targetPath))) {
+      break;
+    }
+
+    if (await isSameAudioContent(targetPath, audio, size)) {
+      session.stats.audioReused++;
+      return targetPath;
+    }
+  }
+
+  // 复制时同时校验内容哈希，损坏的音频对象不会以 saved 状态导入
+  const tempPath = createTempPath(session.audioDir);
+  try {
+    const { hash } = await copyAndHashFile(objectPath, tempPath);
+    if (hash !== audio.hash) {
+      throw new Error(`Corrupted audio in backup: ${audio.hash}`);
+    }
+  } catch (error) {
+    await fs.promises.rm(tempPath, { force: true });
+    throw error;
+  }
+  await fs.promises.rename(tempPath, targetPath);
+  session.stats.audioRestored++;
+  session.restoredAudioPaths.push(targetPath);
+  return targetPath;
+}
+
+async function readLibraryImportBatch(session, offset = 0, count = 100) {
+  const start = Math.max(0, Number(offset) || 0);
+  const entries = session.entries.slice(start, start + Math.max(1, Number(count) || 1));
+  const meetings = [];
+  session.restoredAudioPaths = [];
+
+  try {
+    for (const entry of entries) {
+      const content = await fs.promises.readFile(
+        path.join(session.backupDir, MEETING_OBJECTS_DIR, `${entry.hash}.json`),
+        'utf8'
+      );
+      if (hashContent(content) !== entry.hash) {
+        throw new Error(`Corrupted meeting record in backup: ${entry.hash}`);
+      }
+
+      const meeting = JSON.parse(content);
+      if (entry.audio) {
+        meeting.audioFilename = await restoreAudioObject(session, entry.audio);
+        meeting.audioStorageStatus = 'saved';
+        delete meeting.audioStorageError;
+      } else if (meeting.audioFilename) {
+        delete meeting.audioFilename;
+        meeting.audioStorageStatus = 'failed';
+        meeting.audioStorageError = 'Audio file was not included in the backup';
+      }
+
+      meetings.push(meeting);
+    }
+  } catch (error) {
+    // 本批次读取失败时删除已复制的音频，避免留下没有会议记录引用的文件
+    await Promise.all(session.restoredAudioPaths.map((filePath) => fs.promises.rm(filePath, { force: true })));
+    session.restoredAudioPaths = [];
+    throw error;
+  }
+
+  session.stats.meetings += meetings.length;
+  const nextOffset = start + entries.length;
+
+  return {
+    meetings,
+    // 本批次新复制到音频目录的文件，渲染进程写入 IndexedDB 失败时据此清理
+    restoredAudioPaths: session.restoredAudioPaths,
+    nextOffset,
+    total: session.entries.length,
+    done: nextOffset >= session.entries.length
+  };
+}
+
+module.exports = {
+  LIBRARY_BACKUP_FORMAT,
+  LIBRARY_BACKUP_VERSION,
+  LIBRARY_MANIFEST_FILE,
+  readLibraryManifest,
+  createLibraryBackupSession,
+  backupMeetingRecord,
+  finishLibraryBackup,
+  createLibraryImportSession,
+  readLibraryImportBatch
+};
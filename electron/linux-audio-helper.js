@@ -3,6 +3,12 @@ const util = require('util');
 
 const execPromise = util.promisify(exec);
 
+const LINUX_CAPTURE_MODE_MIXED = 'mixed';
+const LINUX_CAPTURE_MODE_MULTITRACK = 'multitrack';
+// 整场录音的峰值 RMS 低于该阈值时视为该音轨没有有效声音
+const TRACK_SILENCE_THRESHOLD_DB = -50;
+const LEVEL_METER_FILTER = 'astats=metadata=1:reset=1,ametadata=print:key=lavfi.astats.Overall.RMS_level';
+
 function parsePulseSourceList(stdout = '') {
   return stdout
     .split('\n')
@@ -46,6 +52,151 @@ function getAlsaSourceLoadCandidates() {
   return ['hw:0,0', 'hw:1,0', 'hw:0', 'hw:1', 'default'];
 }
 
+function buildMixedCaptureArgs({ outputPath, microphoneDevice, monitorDevice }) {
+  if (microphoneDevice && monitorDevice) {
+    return [
+      '-f', 'pulse',
+      '-i', microphoneDevice,
+      '-f', 'pulse',
+      '-i', monitorDevice,
+      '-filter_complex', `[0:a][1:a]amix=inputs=2:duration=longest:dropout_transition=2,${LEVEL_METER_FILTER}[aout]`,
+      '-map', '[aout]',
+      '-acodec', 'libopus',
+      '-b:a', '128k',
+      '-ar', '48000',
+      '-ac', '2',
+      '-y',
+      outputPath
+    ];
+  }
+
+  const device = microphoneDevice || monitorDevice;
+  return [
+    '-f', 'pulse',
+    '-i', device,
+    '-af', LEVEL_METER_FILTER,
+    '-acodec', 'libopus',
+    '-b:a', '128k',
+    '-ar', '48000',
+    '-ac', microphoneDevice ? '1' : '2',
+    '-y',
+    outputPath
+  ];
+}
+
+// 多音轨录制：麦克风与 monitor 分别写入同一个 Matroska 容器的两条音轨，录制期间不做混音。
+// 音量表由 8kHz 单声道旁路计算（两路合并为双声道以便区分音轨电平），输出到 null muxer。
+function buildMultitrackCaptureArgs({ outputPath, microphoneDevice, monitorDevice }) {
+  const tapFormat = 'aformat=sample_fmts=flt:sample_rates=8000:channel_layouts=mono';
+
+  return [
+    '-f', 'pulse',
+    '-i', microphoneDevice,
+    '-f', 'pulse',
+    '-i', monitorDevice,
+    '-filter_complex', [
+      `[0:a]${tapFormat}[mictap]`,
+      `[1:a]${tapFormat}[systap]`,
+      '[mictap][systap]amerge=inputs=2,astats=metadata=1:reset=1:measure_perchannel=RMS_level:measure_overall=RMS_level,ametadata=print[levels]'
+    ].join(';'),
+    '-map', '0:a',
+    '-map', '1:a',
+    '-c:a', 'libopus',
+    '-b:a', '64k',
+    '-compression_level', '0',
+    '-ar', '48000',
+    '-ac:a:0', '1',
+    '-ac:a:1', '2',
+    '-f', 'matroska',
+    '-y',
+    outputPath,
+    '-map', '[levels]',
+    '-f', 'null',
+    '-'
+  ];
+}
+
+function buildFfmpegCaptureArgs({ outputPath, microphoneDevice, monitorDevice, captureMode = LINUX_CAPTURE_MODE_MIXED }) {
+  if (!microphoneDevice && !monitorDevice) {
+    throw new Error('未检测到可用的 PulseAudio 输入源或 monitor 源');
+  }
+
+  // 只有一个输入源时本来就不需要混音，直接沿用单路录制
+  if (captureMode === LINUX_CAPTURE_MODE_MULTITRACK && microphoneDevice && monitorDevice) {
+    return {
+      captureMode: LINUX_CAPTURE_MODE_MULTITRACK,
+      args: buildMultitrackCaptureArgs({ outputPath, microphoneDevice, monitorDevice })
+    };
+  }
+
+  return {
+    captureMode: LINUX_CAPTURE_MODE_MIXED,
+    args: buildMixedCaptureArgs({ outputPath, microphoneDevice, monitorDevice })
+  };
+}
+
+// 解析 astats 按声道输出的 RMS 电平（多音轨旁路中声道 1 为麦克风，声道 2 为系统音频）
+function parseTrackRmsLevels(message = '') {
+  const levels = [];
+  const pattern = /lavfi\.astats\.(\d+)\.RMS_level=([\-\d\.]+)/g;
+  let match = pattern.exec(message);
+
+  while (match) {
+    const level = parseFloat(match[2]);
+    if (Number.isFinite(level)) {
+      levels[Number(match[1]) - 1] = level;
+    }
+    match = pattern.exec(message);
+  }
+
+  return levels;
+}
+
+function getActiveTrackIndexes(trackPeakRms, trackCount = 2) {
+  if (!Array.isArray(trackPeakRms) || trackPeakRms.length === 0) {
+    return Array.from({ length: trackCount }, (value, index) => index);
+  }
+
+  return Array.from({ length: trackCount }, (value, index) => index)
+    .filter(index => Number.isFinite(trackPeakRms[index]) && trackPeakRms[index] > TRACK_SILENCE_THRESHOLD_DB);
+}
+
+// 统计 `ffmpeg -i` 输出中的音频流数量
+function parseAudioStreamCount(probeOutput) {
+  return (String(probeOutput || '').match(/Stream #0:\d+[^\n]*: Audio:/g) || []).length;
+}
+
+// 在真正需要单轨音频（播放、转写）时再混音；只有一条音轨有声音时直接复制该音轨，不重新编码。
+// 输入已只有一条音轨（例如此前已混音过）时同样直接复制
+function buildDeferredMixArgs({ inputPath, outputPath, trackPeakRms = null, audioStreamCount = 2 }) {
+  const activeTracks = audioStreamCount < 2 ? [0] : getActiveTrackIndexes(trackPeakRms);
+
+  if (activeTracks.length < 2) {
+    const trackIndex = activeTracks.length === 1 ? activeTracks[0] : 0;
+    return [
+      '-i', inputPath,
+      '-map', `0:a:${trackIndex}`,
+      '-c:a', 'copy',
+      '-f', 'webm',
+      '-y',
+      outputPath
+    ];
+  }
+
+  return [
+    '-i', inputPath,
+    '-filter_complex', '[0:a:0][0:a:1]amix=inputs=2:duration=longest:dropout_transition=2[aout]',
+    '-map', '[aout]',
+    '-c:a', 'libopus',
+    '-b:a', '128k',
+    '-ar', '48000',
+    '-ac', '2',
+    '-f', 'webm',
+    '-y',
+    outputPath
+  ];
+}
+
 async function detectAudioSystem() {
   if (process.platform !== 'linux') {
     return { type: 'other', available: false };
@@ -129,6 +280,14 @@ async function resetDependencyCheck(store) {
 }
 
 module.exports = {
+  LINUX_CAPTURE_MODE_MIXED,
+  LINUX_CAPTURE_MODE_MULTITRACK,
+  TRACK_SILENCE_THRESHOLD_DB,
+  buildFfmpegCaptureArgs,
+  parseTrackRmsLevels,
+  parseAudioStreamCount,
+  getActiveTrackIndexes,
+  buildDeferredMixArgs,
   detectAudioSystem,
   checkLinuxDependencies,
   resetDependencyCheck,
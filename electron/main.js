@@ -5,15 +5,27 @@ const Store = require('electron-store');
 const { spawn, exec } = require('child_process');
 const { promisify } = require('util');
 const {
+  LINUX_CAPTURE_MODE_MIXED,
   checkLinuxDependencies,
   parsePulseSourceList,
   chooseRecordingSources,
-  getAlsaSourceLoadCandidates
+  getAlsaSourceLoadCandidates,
+  buildFfmpegCaptureArgs,
+  parseTrackRmsLevels,
+  parseAudioStreamCount,
+  buildDeferredMixArgs
 } = require('./linux-audio-helper');
 const {
   resolveManagedAudioPath,
   createManagedSplitOutputDir
 } = require('./managed-paths');
+const {
+  createLibraryBackupSession,
+  backupMeetingRecord,
+  finishLibraryBackup,
+  createLibraryImportSession,
+  readLibraryImportBatch
+} = require('./library-backup');
 
 // 初始化配置存储
 const store = new Store();
@@ -25,6 +37,8 @@ const isMac = process.platform === 'darwin';
 
 // 音频录制进程（Linux 下使用 ffmpeg）
 let ffmpegSystemAudioProcess = null;
+// 当前 ffmpeg 录制的模式与各音轨峰值电平（多音轨模式下用于延迟混音时跳过静音音轨）
+let ffmpegCaptureState = null;
 let recordingStartTime = null;
 const execAsync = promisify(exec);
 
@@ -294,6 +308,110 @@ ipcMain.handle('export-audio', async (event, { filename, defaultPath }) => {
   }
 });
 
+// 资料库备份：渲染进程分批发送会议记录，主进程流式写入备份目录
+let libraryBackupSession = null;
+let libraryImportSession = null;
+
+async function chooseLibraryBackupDirectory(title) {
+  const { canceled, filePaths } = await dialog.showOpenDialog(mainWindow, {
+    title,
+    properties: ['openDirectory', 'createDirectory']
+  });
+
+  return canceled || !filePaths || !filePaths[0] ? null : filePaths[0];
+}
+
+ipcMain.handle('begin-library-backup', async () => {
+  try {
+    const backupDir = await chooseLibraryBackupDirectory('Choose library backup folder');
+    if (!backupDir) {
+      return { success: false, error: 'User cancelled' };
+    }
+
+    libraryBackupSession = createLibraryBackupSession(backupDir, AUDIO_DIR);
+    return { success: true, backupDir, incremental: Boolean(libraryBackupSession.previous) };
+  } catch (error) {
+    libraryBackupSession = null;
+    safeError('Error starting library backup:', error);
+    return { success: false, error: error.message };
+  }
+});
+
+ipcMain.handle('write-library-backup-batch', async (event, { meetings = [] } = {}) => {
+  if (!libraryBackupSession) {
+    return { success: false, error: 'No library backup in progress' };
+  }
+
+  try {
+    for (const meeting of meetings) {
+      await backupMeetingRecord(libraryBackupSession, meeting);
+    }
+    return { success: true, stats: libraryBackupSession.stats };
+  } catch (error) {
+    libraryBackupSession = null;
+    safeError('Error writing library backup:', error);
+    return { success: false, error: error.message };
+  }
+});
+
+ipcMain.handle('finish-library-backup', async () => {
+  if (!libraryBackupSession) {
+    return { success: false, error: 'No library backup in progress' };
+  }
+
+  const session = libraryBackupSession;
+  libraryBackupSession = null;
+
+  try {
+    const stats = await finishLibraryBackup(session);
+    return { success: true, backupDir: session.backupDir, stats };
+  } catch (error) {
+    safeError('Error finishing library backup:', error);
+    return { success: false, error: error.message };
+  }
+});
+
+ipcMain.handle('begin-library-import', async () => {
+  try {
+    const backupDir = await chooseLibraryBackupDirectory('Choose library backup to import');
+    if (!backupDir) {
+      return { success: false, error: 'User cancelled' };
+    }
+
+    libraryImportSession = createLibraryImportSession(backupDir, AUDIO_DIR);
+    return { success: true, backupDir, total: libraryImportSession.entries.length };
+  } catch (error) {
+    libraryImportSession = null;
+    safeError('Error starting library import:', error);
+    return { success: false, error: error.message };
+  }
+});
+
+ipcMain.handle('read-library-import-batch', async (event, { offset = 0, count = 100 } = {}) => {
+  if (!libraryImportSession) {
+    return { success: false, error: 'No library import in progress' };
+  }
+
+  try {
+    const batch = await readLibraryImportBatch(libraryImportSession, offset, count);
+    return { success: true, ...batch };
+  } catch (error) {
+    libraryImportSession = null;
+    safeError('Error reading library import batch:', error);
+    return { success: false, error: error.message };
+  }
+});
+
+ipcMain.handle('finish-library-import', async () => {
+  if (!libraryImportSession) {
+    return { success: false, error: 'No library import in progress' };
+  }
+
+  const { stats } = libraryImportSession;
+  libraryImportSession = null;
+  return { success: true, stats };
+});
+
 // IPC 处理器：获取音频目录路径
 ipcMain.handle('get-audio-directory', async () => {
   return { success: true, path: AUDIO_DIR };
@@ -382,7 +500,7 @@ async function getDefaultPulseAudioDevice(type = 'output') {
 }
 
 // 在 Linux 下使用 ffmpeg 开始录制系统音频
-ipcMain.handle('start-ffmpeg-system-audio', async (event, { outputPath, device = null, microphoneDevice: preferredMicrophoneDevice = null }) => {
+ipcMain.handle('start-ffmpeg-system-audio', async (event, { outputPath, device = null, microphoneDevice: preferredMicrophoneDevice = null, captureMode = LINUX_CAPTURE_MODE_MIXED }) => {
   if (!isLinux) {
     return { success: false, error: 'FFmpeg system audio recording is only supported on Linux' };
   }
@@ -403,52 +521,20 @@ ipcMain.handle('start-ffmpeg-system-audio', async (event, { outputPath, device =
       : selected.monitor;
     const microphoneDevice = preferredMicrophoneDevice || selected.microphone;
 
-    let args = null;
-
-    if (microphoneDevice && monitorDevice) {
-      args = [
-        '-f', 'pulse',
-        '-i', microphoneDevice,
-        '-f', 'pulse',
-        '-i', monitorDevice,
-        '-filter_complex', '[0:a][1:a]amix=inputs=2:duration=longest:dropout_transition=2,astats=metadata=1:reset=1,ametadata=print:key=lavfi.astats.Overall.RMS_level[aout]',
-        '-map', '[aout]',
-        '-acodec', 'libopus',
-        '-b:a', '128k',
-        '-ar', '48000',
-        '-ac', '2',
-        '-y',
-        outputPath
-      ];
-    } else if (microphoneDevice) {
-      args = [
-        '-f', 'pulse',
-        '-i', microphoneDevice,
-        '-af', 'astats=metadata=1:reset=1,ametadata=print:key=lavfi.astats.Overall.RMS_level',
-        '-acodec', 'libopus',
-        '-b:a', '128k',
-        '-ar', '48000',
-        '-ac', '1',
-        '-y',
-        outputPath
-      ];
-    } else if (monitorDevice) {
-      args = [
-        '-f', 'pulse',
-        '-i', monitorDevice,
-        '-af', 'astats=metadata=1:reset=1,ametadata=print:key=lavfi.astats.Overall.RMS_level',
-        '-acodec', 'libopus',
-        '-b:a', '128k',
-        '-ar', '48000',
-        '-ac', '2',
-        '-y',
-        outputPath
-      ];
-    } else {
-      throw new Error('未检测到可用的 PulseAudio 输入源或 monitor 源');
-    }
+    const capture = buildFfmpegCaptureArgs({
+      outputPath,
+      microphoneDevice,
+      monitorDevice,
+      captureMode
+    });
+    const args = capture.args;
+    const captureState = {
+      captureMode: capture.captureMode,
+      trackPeakRms: []
+    };
+    ffmpegCaptureState = captureState;
 
-    safeLog('Starting ffmpeg mixed audio recording:', args.join(' '));
+    safeLog(`Starting ffmpeg ${capture.captureMode} audio recording:`, args.join(' '));
 
     ffmpegSystemAudioProcess = spawn('ffmpeg', args);
     
@@ -467,6 +553,14 @@ ipcMain.handle('start-ffmpeg-system-audio', async (event, { outputPath, device =
         errorOutput += message;
       }
       
+      // 记录各音轨的峰值电平，停止后据此判断哪些音轨有声音
+      parseTrackRmsLevels(message).forEach((level, index) => {
+        const currentPeak = captureState.trackPeakRms[index];
+        if (currentPeak === undefined || level > currentPeak) {
+          captureState.trackPeakRms[index] = level;
+        }
+      });
+
       // 解析 astats 音量信息 - RMS 电平
       const rmsMatch = message.match(/lavfi\.astats\.Overall\.RMS_level=([\-\d\.]+)/);
       
@@ -521,9 +615,11 @@ ipcMain.handle('start-ffmpeg-system-audio', async (event, { outputPath, device =
       setTimeout(checkStarted, 500);
     });
 
-    return { success: true, pid: ffmpegSystemAudioProcess.pid };
+    return { success: true, pid: ffmpegSystemAudioProcess.pid, captureMode: capture.captureMode };
   } catch (error) {
     safeError('Failed to start ffmpeg system audio recording:', error);
+    // 启动失败时清掉本次的录制状态，避免下次停止录制时返回过期的音轨电平
+    ffmpegCaptureState = null;
     return { success: false, error: error.message };
   }
 });
@@ -573,7 +669,10 @@ ipcMain.handle('stop-ffmpeg-recording', async () => {
       await Promise.all(stopPromises);
     }
 
-    return { success: true, results };
+    const capture = ffmpegCaptureState;
+    ffmpegCaptureState = null;
+
+    return { success: true, results, capture };
   } catch (error) {
     safeError('Error stopping ffmpeg recording:', error);
     return { success: false, error: error.message };
@@ -640,6 +739,85 @@ ipcMain.handle('merge-audio-files', async (event, { microphonePath, systemAudioP
   }
 });
 
+// 用 `ffmpeg -i` 探测音频流数量：未指定输出时 ffmpeg 以非零码退出，流信息在 stderr 中
+function probeAudioStreamCount(filePath) {
+  return new Promise((resolve) => {
+    const ffmpeg = spawn('ffmpeg', ['-hide_banner', '-i', filePath]);
+    let stderr = '';
+
+    ffmpeg.stderr.on('data', (data) => {
+      stderr += data.toString();
+    });
+
+    ffmpeg.on('close', () => {
+      resolve(parseAudioStreamCount(stderr));
+    });
+
+    ffmpeg.on('error', () => {
+      resolve(0);
+    });
+  });
+}
+
+// 多音轨录制的延迟混音：输出单音轨 webm 并替换原文件，供播放与转写使用
+ipcMain.handle('mix-multitrack-audio', async (event, { filePath, trackPeakRms = null }) => {
+  let mixedPath = null;
+
+  try {
+    const managedFilePath = resolveManagedAudioPath(AUDIO_DIR, filePath);
+
+    try {
+      await fs.promises.access(managedFilePath);
+    } catch {
+      return { success: false, error: 'File not found: ' + managedFilePath };
+    }
+
+    mixedPath = `${managedFilePath}.mixed.webm`;
+    // 文件可能已被混音过（例如停止录制后读取失败、随后又走恢复流程），此时只剩一条音轨，直接复制
+    const audioStreamCount = await probeAudioStreamCount(managedFilePath);
+    const args = buildDeferredMixArgs({
+      inputPath: managedFilePath,
+      outputPath: mixedPath,
+      trackPeakRms,
+      audioStreamCount: audioStreamCount || undefined
+    });
+
+    safeLog('Mixing multitrack audio:', args.join(' '));
+
+    await new Promise((resolve, reject) => {
+      const ffmpeg = spawn('ffmpeg', args);
+      let stderr = '';
+
+      ffmpeg.stderr.on('data', (data) => {
+        stderr += data.toString();
+      });
+
+      ffmpeg.on('close', (code) => {
+        if (code === 0) {
+          resolve();
+          return;
+        }
+
+        reject(new Error(stderr || `FFmpeg mix failed with code ${code}`));
+      });
+
+      ffmpeg.on('error', (error) => {
+        reject(error);
+      });
+    });
+
+    await fs.promises.rename(mixedPath, managedFilePath);
+    return { success: true, filePath: managedFilePath };
+  } catch (error) {
+    safeError('Error mixing multitrack audio:', error);
+    // 清理失败留下的半成品，恢复流程会重试同一路径
+    if (mixedPath) {
+      await fs.promises.rm(mixedPath, { force: true }).catch(() => {});
+    }
+    return { success: false, error: error.message };
+  }
+});
+
 // 获取 PulseAudio 音频源列表（Linux）
 ipcMain.handle('get-pulseaudio-sources', async () => {
   if (!isLinux) {
@@ -11,6 +11,14 @@ contextBridge.exposeInMainWorld('electronAPI', {
   exportAudio: (filename, defaultPath) => ipcRenderer.invoke('export-audio', { filename, defaultPath }),
   getAudioDirectory: () => ipcRenderer.invoke('get-audio-directory'),
 
+  // 资料库备份与导入
+  beginLibraryBackup: () => ipcRenderer.invoke('begin-library-backup'),
+  writeLibraryBackupBatch: (meetings) => ipcRenderer.invoke('write-library-backup-batch', { meetings }),
+  finishLibraryBackup: () => ipcRenderer.invoke('finish-library-backup'),
+  beginLibraryImport: () => ipcRenderer.invoke('begin-library-import'),
+  readLibraryImportBatch: (offset, count) => ipcRenderer.invoke('read-library-import-batch', { offset, count }),
+  finishLibraryImport: () => ipcRenderer.invoke('finish-library-import'),
+
   // 配置操作
   saveConfig: (config) => ipcRenderer.invoke('save-config', config),
   loadConfig: () => ipcRenderer.invoke('load-config'),
@@ -32,9 +40,10 @@ contextBridge.exposeInMainWorld('electronAPI', {
   // FFmpeg 相关接口（Linux 系统音频录制）
   checkFFmpeg: () => ipcRenderer.invoke('check-ffmpeg'),
   checkLinuxDependencies: () => ipcRenderer.invoke('check-linux-dependencies'),
-  startFFmpegSystemAudio: (outputPath, device, microphoneDevice) => ipcRenderer.invoke('start-ffmpeg-system-audio', { outputPath, device, microphoneDevice }),
+  startFFmpegSystemAudio: (outputPath, device, microphoneDevice, captureMode) => ipcRenderer.invoke('start-ffmpeg-system-audio', { outputPath, device, microphoneDevice, captureMode }),
   stopFFmpegRecording: () => ipcRenderer.invoke('stop-ffmpeg-recording'),
   mergeAudioFiles: (microphonePath, systemAudioPath, outputPath) => ipcRenderer.invoke('merge-audio-files', { microphonePath, systemAudioPath, outputPath }),
+  mixMultitrackAudio: (filePath, trackPeakRms) => ipcRenderer.invoke('mix-multitrack-audio', { filePath, trackPeakRms }),
   getPulseAudioSources: () => ipcRenderer.invoke('get-pulseaudio-sources'),
   getAudioSourceOptions: () => ipcRenderer.invoke('get-audio-source-options'),
   checkPulseAudioInput: () => ipcRenderer.invoke('check-pulseaudio-input'),
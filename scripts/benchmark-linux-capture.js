@@ -0,0 +1,106 @@
+// 对比 Linux 两种录制模式的 CPU 开销：用 lavfi 合成的麦克风/系统音频替代 PulseAudio 输入，
+// 不加 -re 以最快速度处理指定时长的音频，ffmpeg -benchmark 输出的 utime+stime 即处理这段音频所需的 CPU 时间。
+// 用法：node scripts/benchmark-linux-capture.js [秒数，默认 3600]
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawn } = require('child_process');
+const {
+  LINUX_CAPTURE_MODE_MIXED,
+  LINUX_CAPTURE_MODE_MULTITRACK,
+  buildFfmpegCaptureArgs,
+  buildDeferredMixArgs
+} = require('../electron/linux-audio-helper');
+
+function withSyntheticInputs(args, durationSeconds) {
+  const sources = {
+    microphone: `sine=frequency=220:sample_rate=48000:duration=${durationSeconds}`,
+    monitor: `anoisesrc=color=pink:amplitude=0.2:sample_rate=48000:duration=${durationSeconds},aformat=channel_layouts=stereo`
+  };
+
+  return args.map((arg, index) => {
+    if (arg === 'pulse' && args[index - 1] === '-f') {
+      return 'lavfi';
+    }
+
+    if (args[index - 1] === '-i' && sources[arg]) {
+      return sources[arg];
+    }
+
+    return arg;
+  });
+}
+
+function runFfmpegBenchmark(args) {
+  return new Promise((resolve, reject) => {
+    const ffmpeg = spawn('ffmpeg', ['-hide_banner', '-nostats', '-benchmark', ...args]);
+    let stderr = '';
+
+    ffmpeg.stderr.on('data', (data) => {
+      stderr = (stderr + data.toString()).slice(-65536);
+    });
+
+    ffmpeg.on('error', reject);
+    ffmpeg.on('close', (code) => {
+      const match = stderr.match(/bench: utime=([\d.]+)s stime=([\d.]+)s rtime=([\d.]+)s/);
+
+      if (code !== 0 || !match) {
+        reject(new Error(`FFmpeg benchmark failed with code ${code}: ${stderr}`));
+        return;
+      }
+
+      resolve({
+        cpuSeconds: parseFloat(match[1]) + parseFloat(match[2]),
+        wallSeconds: parseFloat(match[3])
+      });
+    });
+  });
+}
+
+async function main() {
+  const durationSeconds = Number(process.argv[2]) || 3600;
+  const workDir = fs.mkdtempSync(path.join(os.tmpdir(), 'capture-benchmark-'));
+  const captureOptions = (captureMode, outputPath) => ({
+    outputPath,
+    microphoneDevice: 'microphone',
+    monitorDevice: 'monitor',
+    captureMode
+  });
+
+  try {
+    const mixedPath = path.join(workDir, 'mixed.webm');
+    const multitrackPath = path.join(workDir, 'multitrack.webm');
+
+    const mixed = await runFfmpegBenchmark(withSyntheticInputs(
+      buildFfmpegCaptureArgs(captureOptions(LINUX_CAPTURE_MODE_MIXED, mixedPath)).args,
+      durationSeconds
+    ));
+    const multitrack = await runFfmpegBenchmark(withSyntheticInputs(
+      buildFfmpegCaptureArgs(captureOptions(LINUX_CAPTURE_MODE_MULTITRACK, multitrackPath)).args,
+      durationSeconds
+    ));
+    const deferredMix = await runFfmpegBenchmark(buildDeferredMixArgs({
+      inputPath: multitrackPath,
+      outputPath: path.join(workDir, 'multitrack.mixed.webm')
+    }));
+    const deferredCopy = await runFfmpegBenchmark(buildDeferredMixArgs({
+      inputPath: multitrackPath,
+      outputPath: path.join(workDir, 'multitrack.copy.webm'),
+      trackPeakRms: [-20, -90]
+    }));
+
+    const toPercent = (cpuSeconds) => `${(cpuSeconds / durationSeconds * 100).toFixed(2)}%`;
+    console.log(`Audio duration: ${durationSeconds}s`);
+    console.log(`mixed capture        cpu=${mixed.cpuSeconds.toFixed(1)}s  avg core usage while recording=${toPercent(mixed.cpuSeconds)}`);
+    console.log(`multitrack capture   cpu=${multitrack.cpuSeconds.toFixed(1)}s  avg core usage while recording=${toPercent(multitrack.cpuSeconds)}`);
+    console.log(`deferred mix (both)  cpu=${deferredMix.cpuSeconds.toFixed(1)}s  wall=${deferredMix.wallSeconds.toFixed(1)}s`);
+    console.log(`deferred copy (one)  cpu=${deferredCopy.cpuSeconds.toFixed(1)}s  wall=${deferredCopy.wallSeconds.toFixed(1)}s`);
+  } finally {
+    fs.rmSync(workDir, { recursive: true, force: true });
+  }
+}
+
+main().catch((error) => {
+  console.error(error.message);
+  process.exit(1);
+});
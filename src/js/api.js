@@ -20,6 +20,116 @@ async function fetchWithTimeout(url, options, timeout = 600000) {
     }
 }
 
+// 对冲请求：首个请求超过 hedgeDelay 仍未返回时再发一个相同请求，先返回者胜出
+// 返回胜出请求的响应及其自身耗时（从该请求发出时算起），用于记录延迟样本
+function fetchWithHedge(url, options, timeout, hedgeDelay) {
+    return new Promise((resolve, reject) => {
+        const controllers = [];
+        let settled = false;
+        let inFlight = 0;
+        let hedgeTimeoutId = null;
+
+        const timeoutId = setTimeout(() => {
+            controllers.forEach((controller) => controller.abort());
+        }, timeout);
+
+        const settle = (callback, value) => {
+            if (settled) {
+                return;
+            }
+
+            settled = true;
+            clearTimeout(timeoutId);
+            clearTimeout(hedgeTimeoutId);
+            callback(value);
+        };
+
+        const launch = () => {
+            const controller = new AbortController();
+            const launchedAt = Date.now();
+            controllers.push(controller);
+            inFlight++;
+
+            fetch(url, {
+                ...options,
+                signal: controller.signal
+            }).then((response) => {
+                controllers
+                    .filter((other) => other !== controller)
+                    .forEach((other) => other.abort());
+                settle(resolve, { response, durationMs: Date.now() - launchedAt });
+            }, (error) => {
+                inFlight--;
+                if (inFlight > 0) {
+                    return;
+                }
+
+                settle(reject, error.name === 'AbortError'
+                    ? new Error(`请求超时（${timeout / 1000}秒）`)
+                    : error);
+            });
+        };
+
+        launch();
+        hedgeTimeoutId = setTimeout(() => {
+            if (!settled && inFlight > 0) {
+                console.log(`请求超过 ${hedgeDelay}ms 未返回，发送对冲请求:`, { url });
+                launch();
+            }
+        }, hedgeDelay);
+    });
+}
+
+function getRequestLatencyModel() {
+    if (typeof require === 'function') {
+        try {
+            return require('./latency-model');
+        } catch (error) {
+            // 浏览器环境下通过全局变量加载
+        }
+    }
+
+    if (typeof window !== 'undefined' && window.requestLatencyModel) {
+        return window.requestLatencyModel;
+    }
+
+    return null;
+}
+
+// 根据历史耗时推导超时并记录本次耗时；样本不足时使用 fallbackTimeout
+async function fetchWithLatencyTracking(url, options, { latencyKind, model, units, fallbackTimeout }) {
+    const latencyModel = getRequestLatencyModel();
+
+    if (!latencyModel) {
+        return await fetchWithTimeout(url, options, fallbackTimeout);
+    }
+
+    const latencyKey = latencyModel.buildLatencyKey(latencyKind, url, model);
+    const timeout = latencyModel.getAdaptiveTimeout(latencyKey, units, fallbackTimeout);
+    const hedgeDelay = latencyModel.getHedgeDelay(latencyKey, units, timeout);
+    const startedAt = Date.now();
+
+    try {
+        // 对冲胜出时按胜出请求自身的耗时记录，否则样本总是不低于对冲延迟，p95 会不断被推高
+        const { response, durationMs } = hedgeDelay
+            ? await fetchWithHedge(url, options, timeout, hedgeDelay)
+            : { response: await fetchWithTimeout(url, options, timeout), durationMs: Date.now() - startedAt };
+
+        if (response.ok) {
+            latencyModel.recordRequestLatency(latencyKey, units, durationMs);
+        }
+
+        return response;
+    } catch (error) {
+        // 超时也是有效的尾延迟信号，按实际等待时长计入
+        if (isTimeoutErrorMessage(error)) {
+            latencyModel.recordRequestLatency(latencyKey, units, Date.now() - startedAt);
+        }
+
+        throw error;
+    }
+}
+
 function delay(ms) {
     return new Promise((resolve) => setTimeout(resolve, ms));
 }
@@ -77,6 +187,12 @@ function getMeetingTitleRequestTimeout(summary) {
     return Math.min(baseTimeout + extraTimeout, maxTimeout);
 }
 
+// 文本请求的规模单位与上面的启发式超时保持一致（每 N 个字符计 1 个单位）
+function getTextLatencyUnits(text, charsPerUnit) {
+    const textLength = typeof text === 'string' ? text.trim().length : 0;
+    return textLength / charsPerUnit;
+}
+
 function normalizeProviderText(value) {
     return String(value || '')
         .trim()
@@ -454,10 +570,16 @@ function resolveAudioTranscriptionEndpoint(apiUrl) {
     return apiUrl;
 }
 
-async function dispatchTranscriptionRequest(audioBlob, apiUrl, apiKey, model, timeout = 600000, filename = null) {
+async function dispatchTranscriptionRequest(audioBlob, apiUrl, apiKey, model, fallbackTimeout = 600000, filename = null) {
     const { isBailian, isDashScopeCompatible, isSiliconFlow } = resolveTranscriptionProvider(apiUrl);
     const audioFormat = detectAudioFormat(audioBlob);
     const uploadFilename = filename || `recording.${audioFormat}`;
+    const latencyProfile = {
+        latencyKind: 'transcription',
+        model,
+        units: audioBlob.size / (1024 * 1024),
+        fallbackTimeout
+    };
 
     if (isBailian) {
         const base64Audio = await blobToBase64(audioBlob);
@@ -474,14 +596,14 @@ async function dispatchTranscriptionRequest(audioBlob, apiUrl, apiKey, model, ti
         };
 
         console.log('发送百炼录音文件识别请求:', { url: apiUrl, model });
-        return await fetchWithTimeout(apiUrl, {
+        return await fetchWithLatencyTracking(apiUrl, {
             method: 'POST',
             headers: {
                 'Authorization': `Bearer ${apiKey}`,
                 'Content-Type': 'application/json'
             },
             body: JSON.stringify(requestBody)
-        }, timeout);
+        }, latencyProfile);
     }
 
     const audioEndpoint = (isDashScopeCompatible || isSiliconFlow)
@@ -499,13 +621,13 @@ async function dispatchTranscriptionRequest(audioBlob, apiUrl, apiKey, model, ti
     }
 
     console.log(`发送 ${providerLabel} 请求:`, { url: audioEndpoint, model });
-    return await fetchWithTimeout(audioEndpoint, {
+    return await fetchWithLatencyTracking(audioEndpoint, {
         method: 'POST',
         headers: {
             'Authorization': `Bearer ${apiKey}`
         },
         body: formData
-    }, timeout);
+    }, latencyProfile);
 }
 
 function extractTranscriptText(data) {
@@ -772,6 +894,7 @@ async function audioBufferToWebm(audioBuffer) {
 
 // 分段转写音频
 async function transcribeAudioSegments(audioBlob, apiUrl, apiKey, model = 'whisper-1', audioFilePath = null, onProgress = null) {
+    // 每个片段的实际超时由耗时模型按片段大小推导，样本不足时回退到 10 分钟
     const requestTimeout = 600000;
     // 直接使用原始 webm，不需要转换为 WAV
     const sizeMB = audioBlob.size / (1024 * 1024);
@@ -784,7 +907,7 @@ async function transcribeAudioSegments(audioBlob, apiUrl, apiKey, model = 'whisp
     
     console.log(`音频信息: ${durationMinutes.toFixed(2)}分钟, ${sizeMB.toFixed(2)}MB`);
     
-    console.log(`转写超时时间: ${(requestTimeout / 1000 / 60).toFixed(1)}分钟`);
+    console.log(`转写默认超时时间: ${(requestTimeout / 1000 / 60).toFixed(1)}分钟`);
     
     // 检查是否需要分割
     const needsSplit = sizeMB > 50 || (hasKnownDuration && durationMinutes > 60);
@@ -949,11 +1072,12 @@ ${transcript}
 
         const maxAttempts = 3;
         const requestTimeout = getSummaryRequestTimeout(transcript);
+        const transcriptUnits = getTextLatencyUnits(transcript, 1000);
         const maxBackoff = 2000;
 
         for (let attempt = 1; attempt <= maxAttempts; attempt++) {
             try {
-                const response = await fetchWithTimeout(apiUrl, {
+                const response = await fetchWithLatencyTracking(apiUrl, {
                     method: 'POST',
                     headers: {
                         'Authorization': `Bearer ${apiKey}`,
@@ -967,7 +1091,12 @@ ${transcript}
                         temperature: 0.7,
                         max_tokens: 2000
                     })
-                }, requestTimeout);
+                }, {
+                    latencyKind: 'summary',
+                    model,
+                    units: transcriptUnits,
+                    fallbackTimeout: requestTimeout
+                });
 
                 if (!response.ok) {
                     const error = new Error(await parseSummaryError(response));
@@ -1041,7 +1170,7 @@ ${summary}`;
     try {
         for (let attempt = 1; attempt <= maxAttempts; attempt++) {
             try {
-                const response = await fetchWithTimeout(apiUrl, {
+                const response = await fetchWithLatencyTracking(apiUrl, {
                     method: 'POST',
                     headers: {
                         'Authorization': `Bearer ${apiKey}`,
@@ -1059,7 +1188,12 @@ ${summary}`;
                             disableThinking: true
                         }
                     ))
-                }, requestTimeout);
+                }, {
+                    latencyKind: 'title',
+                    model,
+                    units: getTextLatencyUnits(summary, 500),
+                    fallbackTimeout: requestTimeout
+                });
 
                 if (!response.ok) {
                     const error = new Error(await parseSummaryError(response));
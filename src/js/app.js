@@ -49,8 +49,10 @@ function getAudioSourceHelper() {
         AUDIO_SOURCE_UNAVAILABLE: 'unavailable',
         getDefaultAudioSourceSettings: () => ({
             preferredMicSource: 'auto',
-            preferredSystemSource: 'auto'
+            preferredSystemSource: 'auto',
+            linuxCaptureMode: 'mixed'
         }),
+        getLinuxCaptureModeOptions: () => [],
         resolvePreferredAudioSource: ({ preferredSource, recommendedSource }) => preferredSource || recommendedSource || 'auto',
         buildLinuxAudioSourceState: () => ({
             microphoneSources: [],
@@ -251,6 +253,8 @@ async function refreshAudioSourceOptions({ silent = false } = {}) {
     const {
         AUDIO_SOURCE_AUTO,
         AUDIO_SOURCE_UNAVAILABLE,
+        getDefaultAudioSourceSettings,
+        getLinuxCaptureModeOptions,
         resolvePreferredAudioSource,
         buildLinuxAudioSourceState
     } = getAudioSourceHelper();
@@ -330,6 +334,8 @@ async function refreshAudioSourceOptions({ silent = false } = {}) {
         systemSources: systemOptions,
         selectedMicSource,
         selectedSystemSource,
+        captureModeOptions: platform === 'linux' ? getLinuxCaptureModeOptions() : [],
+        selectedCaptureMode: getDefaultAudioSourceSettings(currentSettings || {}).linuxCaptureMode,
         statusText
     });
 
@@ -391,6 +397,8 @@ function setupEventListeners() {
     document.getElementById('btnSaveTemplate').addEventListener('click', handleSaveTemplate);
     document.getElementById('btnRefreshAudioSources').addEventListener('click', () => refreshAudioSourceOptions());
     document.getElementById('btnSaveAudioSources').addEventListener('click', handleSaveAudioSources);
+    document.getElementById('btnBackupLibrary')?.addEventListener('click', handleBackupLibrary);
+    document.getElementById('btnImportLibrary')?.addEventListener('click', handleImportLibrary);
 }
 
 let isRecordingWorkflowBusy = false;
@@ -966,7 +974,8 @@ async function handleSaveAudioSources() {
         currentSettings = {
             ...currentSettings,
             preferredMicSource: settings.preferredMicSource,
-            preferredSystemSource: settings.preferredSystemSource
+            preferredSystemSource: settings.preferredSystemSource,
+            linuxCaptureMode: settings.linuxCaptureMode
         };
 
         await persistSettings(currentSettings);
@@ -979,6 +988,77 @@ async function handleSaveAudioSources() {
     }
 }
 
+function setLibraryBackupStatus(message) {
+    const statusElement = document.getElementById('libraryBackupStatus');
+    if (statusElement) {
+        statusElement.textContent = message;
+    }
+}
+
+function setLibraryBackupButtonsDisabled(disabled) {
+    ['btnBackupLibrary', 'btnImportLibrary'].forEach((id) => {
+        const button = document.getElementById(id);
+        if (button) {
+            button.disabled = disabled;
+        }
+    });
+}
+
+async function handleBackupLibrary() {
+    setLibraryBackupButtonsDisabled(true);
+    try {
+        const result = await backupMeetingLibrary((stats) => {
+            setLibraryBackupStatus(`正在备份... 已处理 ${stats.meetings} 条会议记录`);
+        });
+
+        if (result.success) {
+            const { stats } = result;
+            setLibraryBackupStatus(`上次备份：${result.backupDir}`);
+            showToast(`资料库已备份：${stats.meetings} 条记录，新写入 ${stats.meetingsWritten} 条记录和 ${stats.audioWritten} 个音频文件`, 'success');
+        } else if (result.error !== 'User cancelled') {
+            setLibraryBackupStatus('');
+            showToast('备份资料库失败: ' + result.error, 'error');
+        }
+    } catch (error) {
+        console.error('Failed to back up library:', error);
+        setLibraryBackupStatus('');
+        showToast('备份资料库失败', 'error');
+    } finally {
+        setLibraryBackupButtonsDisabled(false);
+    }
+}
+
+async function handleImportLibrary() {
+    const overwrite = confirm('本机已有同一条会议记录时，是否用备份中的版本覆盖？\n选择“取消”将保留本机记录，只导入本机没有的会议。');
+
+    setLibraryBackupButtonsDisabled(true);
+    try {
+        const result = await importMeetingLibrary(({ imported, total }) => {
+            setLibraryBackupStatus(`正在导入... ${imported}/${total}`);
+        }, { overwrite });
+
+        if (result.success) {
+            const { stats } = result;
+            const details = [
+                stats.skipped > 0 ? `跳过本机已有的 ${stats.skipped} 条` : '',
+                stats.overwritten > 0 ? `覆盖 ${stats.overwritten} 条` : ''
+            ].filter(Boolean).join('，');
+            setLibraryBackupStatus('');
+            showToast(`已导入 ${stats.imported} 条会议记录${details ? `（${details}）` : ''}`, 'success');
+            loadHistoryList();
+        } else if (result.error !== 'User cancelled') {
+            setLibraryBackupStatus('');
+            showToast('导入备份失败: ' + result.error, 'error');
+        }
+    } catch (error) {
+        console.error('Failed to import library:', error);
+        setLibraryBackupStatus('');
+        showToast('导入备份失败', 'error');
+    } finally {
+        setLibraryBackupButtonsDisabled(false);
+    }
+}
+
 async function viewMeetingDetail(id) {
     try {
         const meeting = await getMeeting(id);
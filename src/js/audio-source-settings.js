@@ -1,13 +1,25 @@
 const AUDIO_SOURCE_AUTO = 'auto';
 const AUDIO_SOURCE_UNAVAILABLE = 'unavailable';
+const LINUX_CAPTURE_MODE_MIXED = 'mixed';
+const LINUX_CAPTURE_MODE_MULTITRACK = 'multitrack';
 
 function getDefaultAudioSourceSettings(settings = {}) {
     return {
         preferredMicSource: settings.preferredMicSource || AUDIO_SOURCE_AUTO,
-        preferredSystemSource: settings.preferredSystemSource || AUDIO_SOURCE_AUTO
+        preferredSystemSource: settings.preferredSystemSource || AUDIO_SOURCE_AUTO,
+        linuxCaptureMode: settings.linuxCaptureMode === LINUX_CAPTURE_MODE_MULTITRACK
+            ? LINUX_CAPTURE_MODE_MULTITRACK
+            : LINUX_CAPTURE_MODE_MIXED
     };
 }
 
+function getLinuxCaptureModeOptions() {
+    return [
+        { id: LINUX_CAPTURE_MODE_MIXED, label: '实时混音（默认）' },
+        { id: LINUX_CAPTURE_MODE_MULTITRACK, label: '分轨录制（录制时占用更低，停止后混音）' }
+    ];
+}
+
 function resolvePreferredAudioSource({ preferredSource, sources = [], recommendedSource = null }) {
     if (preferredSource && preferredSource !== AUDIO_SOURCE_AUTO) {
         const matched = sources.find(source => source.id === preferredSource);
@@ -61,7 +73,10 @@ function buildLinuxAudioSourceState(sources = []) {
 const exported = {
     AUDIO_SOURCE_AUTO,
     AUDIO_SOURCE_UNAVAILABLE,
+    LINUX_CAPTURE_MODE_MIXED,
+    LINUX_CAPTURE_MODE_MULTITRACK,
     getDefaultAudioSourceSettings,
+    getLinuxCaptureModeOptions,
     resolvePreferredAudioSource,
     buildLinuxAudioSourceState
 };
@@ -0,0 +1,225 @@
+// 按服务商/模型记录请求耗时，用观测到的分位数推导超时与对冲请求时机
+// 样本按请求规模（音频 MB / 文本长度）归一化，持久化在 localStorage 中
+
+const LATENCY_STORAGE_KEY = 'requestLatencyStats';
+const LATENCY_STATS_VERSION = 1;
+const MAX_SAMPLES_PER_KEY = 50;
+const MAX_TRACKED_KEYS = 32;
+const MIN_SAMPLES_FOR_ESTIMATE = 5;
+const TIMEOUT_PERCENTILE = 0.95;
+const TIMEOUT_SAFETY_FACTOR = 3;
+const HEDGE_PERCENTILE = 0.95;
+
+// baseUnits 近似表示固定开销（建连、排队、首 token），避免小请求按规模缩放后超时过短
+const LATENCY_PROFILES = {
+    transcription: {
+        baseUnits: 1,
+        minTimeout: 30000,
+        maxTimeout: 600000,
+        // 音频上传体积大，重复发送一次的代价过高，默认不做对冲
+        hedge: false
+    },
+    summary: {
+        baseUnits: 1,
+        minTimeout: 15000,
+        maxTimeout: 120000,
+        hedge: true
+    },
+    title: {
+        baseUnits: 1,
+        minTimeout: 10000,
+        maxTimeout: 30000,
+        hedge: true
+    }
+};
+
+let latencyStats = null;
+
+function getLatencyStorage() {
+    if (typeof localStorage !== 'undefined' && localStorage && typeof localStorage.getItem === 'function') {
+        return localStorage;
+    }
+
+    return null;
+}
+
+function createEmptyLatencyStats() {
+    return {
+        version: LATENCY_STATS_VERSION,
+        entries: {}
+    };
+}
+
+function loadLatencyStats() {
+    if (latencyStats) {
+        return latencyStats;
+    }
+
+    latencyStats = createEmptyLatencyStats();
+    const storage = getLatencyStorage();
+
+    if (!storage) {
+        return latencyStats;
+    }
+
+    try {
+        const raw = storage.getItem(LATENCY_STORAGE_KEY);
+        const parsed = typeof raw === 'string' && raw ? JSON.parse(raw) : null;
+
+        if (parsed && parsed.version === LATENCY_STATS_VERSION && parsed.entries && typeof parsed.entries === 'object') {
+            latencyStats = parsed;
+        }
+    } catch (error) {
+        console.warn('[Latency] 读取请求耗时统计失败，已重置:', error.message);
+    }
+
+    return latencyStats;
+}
+
+function persistLatencyStats() {
+    const storage = getLatencyStorage();
+
+    if (!storage || !latencyStats) {
+        return;
+    }
+
+    try {
+        storage.setItem(LATENCY_STORAGE_KEY, JSON.stringify(latencyStats));
+    } catch (error) {
+        console.warn('[Latency] 保存请求耗时统计失败:', error.message);
+    }
+}
+
+function getLatencyProfile(kind) {
+    return LATENCY_PROFILES[kind] || LATENCY_PROFILES.summary;
+}
+
+function normalizeLatencyEndpoint(apiUrl) {
+    return String(apiUrl || '')
+        .trim()
+        .toLowerCase()
+        .split(/[?#]/)[0]
+        .replace(/\/+$/, '');
+}
+
+function buildLatencyKey(kind, apiUrl, model) {
+    return `${kind}|${normalizeLatencyEndpoint(apiUrl)}|${String(model || '').trim().toLowerCase()}`;
+}
+
+function getLatencyKind(key) {
+    return String(key).split('|')[0];
+}
+
+function toValidUnits(units) {
+    return Number.isFinite(units) && units > 0 ? units : 0;
+}
+
+function evictStaleLatencyEntries(entries) {
+    const keys = Object.keys(entries);
+
+    if (keys.length <= MAX_TRACKED_KEYS) {
+        return;
+    }
+
+    keys
+        .sort((a, b) => (entries[a].updatedAt || 0) - (entries[b].updatedAt || 0))
+        .slice(0, keys.length - MAX_TRACKED_KEYS)
+        .forEach((key) => {
+            delete entries[key];
+        });
+}
+
+function recordRequestLatency(key, units, durationMs) {
+    if (!key || !Number.isFinite(durationMs) || durationMs < 0) {
+        return;
+    }
+
+    const stats = loadLatencyStats();
+    const entry = stats.entries[key] || { samples: [], updatedAt: 0 };
+
+    entry.samples.push([Math.round(durationMs), toValidUnits(units)]);
+    if (entry.samples.length > MAX_SAMPLES_PER_KEY) {
+        entry.samples.splice(0, entry.samples.length - MAX_SAMPLES_PER_KEY);
+    }
+    entry.updatedAt = Date.now();
+
+    stats.entries[key] = entry;
+    evictStaleLatencyEntries(stats.entries);
+    persistLatencyStats();
+}
+
+function getPercentile(sortedValues, percentile) {
+    if (sortedValues.length === 0) {
+        return null;
+    }
+
+    const index = Math.min(sortedValues.length - 1, Math.ceil(percentile * sortedValues.length) - 1);
+    return sortedValues[Math.max(0, index)];
+}
+
+// 将历史样本按请求规模线性缩放到本次请求，再取分位数
+function estimateRequestLatency(key, units, percentile = TIMEOUT_PERCENTILE) {
+    const entry = loadLatencyStats().entries[key];
+
+    if (!entry || !Array.isArray(entry.samples) || entry.samples.length < MIN_SAMPLES_FOR_ESTIMATE) {
+        return null;
+    }
+
+    const { baseUnits } = getLatencyProfile(getLatencyKind(key));
+    const targetUnits = toValidUnits(units) + baseUnits;
+    const scaledDurations = entry.samples
+        .map(([durationMs, sampleUnits]) => durationMs * targetUnits / (toValidUnits(sampleUnits) + baseUnits))
+        .sort((a, b) => a - b);
+
+    return getPercentile(scaledDurations, percentile);
+}
+
+function getAdaptiveTimeout(key, units, fallbackTimeout) {
+    const estimate = estimateRequestLatency(key, units, TIMEOUT_PERCENTILE);
+
+    if (estimate === null) {
+        return fallbackTimeout;
+    }
+
+    const { minTimeout, maxTimeout } = getLatencyProfile(getLatencyKind(key));
+    return Math.round(Math.min(Math.max(estimate * TIMEOUT_SAFETY_FACTOR, minTimeout), maxTimeout));
+}
+
+// 返回 null 表示不发对冲请求（样本不足或该类请求不适合重复发送）
+function getHedgeDelay(key, units, timeout) {
+    if (!getLatencyProfile(getLatencyKind(key)).hedge) {
+        return null;
+    }
+
+    const estimate = estimateRequestLatency(key, units, HEDGE_PERCENTILE);
+
+    if (estimate === null || (Number.isFinite(timeout) && estimate >= timeout)) {
+        return null;
+    }
+
+    return Math.max(1, Math.round(estimate));
+}
+
+function resetRequestLatencyStats() {
+    latencyStats = createEmptyLatencyStats();
+    persistLatencyStats();
+}
+
+const requestLatencyModel = {
+    LATENCY_PROFILES,
+    MIN_SAMPLES_FOR_ESTIMATE,
+    buildLatencyKey,
+    recordRequestLatency,
+    estimateRequestLatency,
+    getAdaptiveTimeout,
+    getHedgeDelay,
+    resetRequestLatencyStats
+};
+
+if (typeof window !== 'undefined') {
+    window.requestLatencyModel = requestLatencyModel;
+}
+
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = requestLatencyModel;
+}
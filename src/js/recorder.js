@@ -260,11 +260,19 @@ async function startLinuxRecording() {
         const sysResult = await window.electronAPI.startFFmpegSystemAudio(
             linuxRecordingPaths.output,
             preferredLinuxSystemSource,
-            preferredLinuxMicSource
+            preferredLinuxMicSource,
+            savedSettings.linuxCaptureMode
         );
         if (!sysResult.success) {
             throw new Error('启动 Linux 录音失败: ' + sysResult.error);
         }
+
+        // 分轨录制的临时文件需要混音后才能播放，记录到恢复元数据中供异常退出后恢复使用
+        if (sysResult.captureMode === 'multitrack') {
+            linuxRecordingPaths.captureMode = sysResult.captureMode;
+            recoveryMeta.captureMode = sysResult.captureMode;
+            await window.electronAPI.writeRecoveryMeta(recoveryMeta);
+        }
         
         // 设置 FFmpeg 录制标志（isRecording 已经在前面设置）
         isFFmpegRecording = true;
@@ -590,7 +598,22 @@ async function stopLinuxRecording() {
             throw new Error('录音路径未设置');
         }
 
-        await window.electronAPI.stopFFmpegRecording();
+        const stopResult = await window.electronAPI.stopFFmpegRecording();
+
+        if (linuxRecordingPaths.captureMode === 'multitrack') {
+            const trackPeakRms = stopResult && stopResult.capture ? stopResult.capture.trackPeakRms : null;
+            const mixResult = await window.electronAPI.mixMultitrackAudio(linuxRecordingPaths.output, trackPeakRms);
+            if (!mixResult.success) {
+                throw new Error('合并分轨音频失败: ' + mixResult.error);
+            }
+
+            // 临时文件已替换为单音轨，同步恢复元数据，避免读取失败或异常退出后恢复流程重复混音
+            linuxRecordingPaths.captureMode = 'mixed';
+            if (typeof recoveryMeta !== 'undefined' && recoveryMeta) {
+                recoveryMeta.captureMode = 'mixed';
+                await window.electronAPI.writeRecoveryMeta(recoveryMeta);
+            }
+        }
 
         const readResult = await window.electronAPI.readAudioFile(linuxRecordingPaths.output);
         if (!readResult.success) {
@@ -5,6 +5,8 @@
 
 const RECOVERY_META_FILE = 'recovery_meta.json';
 const TEMP_SAVE_INTERVAL = 5 * 60 * 1000; // 5分钟
+// 分轨临时文件混音失败时只保留麦克风音轨：仅第一条音轨视为有声，主进程直接复制该音轨
+const MULTITRACK_FALLBACK_TRACK_PEAKS = [0, null];
 
 let tempSaveTimer = null;
 let recoveryMeta = null;
@@ -195,6 +197,21 @@ async function recoverAudioBlob(meta) {
     
     try {
         const tempPath = targetMeta.tempFile;
+
+        // 分轨录制的临时文件包含两条音轨，先混音为单音轨再读取
+        if (targetMeta.captureMode === 'multitrack' && typeof window.electronAPI.mixMultitrackAudio === 'function') {
+            let mixResult = await window.electronAPI.mixMultitrackAudio(tempPath, null);
+            if (!mixResult.success) {
+                console.warn('[Recovery] Multitrack mix failed, recovering the first track only:', mixResult.error);
+                mixResult = await window.electronAPI.mixMultitrackAudio(tempPath, MULTITRACK_FALLBACK_TRACK_PEAKS);
+            }
+            if (!mixResult.success) {
+                throw new Error('Failed to mix multitrack temp audio');
+            }
+            targetMeta.captureMode = 'mixed';
+            await window.electronAPI.writeRecoveryMeta(targetMeta);
+        }
+
         const readResult = await window.electronAPI.readAudioFile(tempPath);
 
         if (!readResult.success) {
@@ -2,6 +2,7 @@ const DB_NAME = 'MeetingMinutesDB';
 const DB_VERSION = 2;
 const STORE_NAME = 'meetings';
 const SETTINGS_STORE_NAME = 'settings';
+const LIBRARY_BATCH_SIZE = 100;
 
 let db = null;
 
@@ -235,6 +236,71 @@ function getAllMeetings() {
     });
 }
 
+// 按主键顺序分批读取会议记录，避免一次性把整个资料库载入内存
+function getMeetingsBatch(afterId, count = LIBRARY_BATCH_SIZE) {
+    return new Promise((resolve, reject) => {
+        const transaction = db.transaction([STORE_NAME], 'readonly');
+        const objectStore = transaction.objectStore(STORE_NAME);
+        const range = afterId === undefined || afterId === null ? null : IDBKeyRange.lowerBound(afterId, true);
+        const request = objectStore.getAll(range, count);
+
+        request.onsuccess = () => {
+            resolve(request.result);
+        };
+
+        request.onerror = () => {
+            reject(new Error('Failed to get meetings batch'));
+        };
+    });
+}
+
+// 在单个事务中批量写入会议记录（导入用），记录中的音频已由主进程恢复到音频目录
+// 默认跳过本机已存在的 id，避免旧备份覆盖之后编辑过的记录；overwrite 为 true 时才覆盖
+function saveMeetingsBulk(meetings, { overwrite = false } = {}) {
+    return new Promise((resolve, reject) => {
+        const result = { saved: 0, skipped: 0, overwritten: 0, skippedIds: [] };
+
+        if (!meetings || meetings.length === 0) {
+            resolve(result);
+            return;
+        }
+
+        const transaction = db.transaction([STORE_NAME], 'readwrite');
+        const objectStore = transaction.objectStore(STORE_NAME);
+
+        meetings.forEach((meeting) => {
+            const keyRequest = objectStore.getKey(meeting.id);
+
+            keyRequest.onsuccess = () => {
+                const exists = keyRequest.result !== undefined;
+                if (exists && !overwrite) {
+                    result.skipped++;
+                    result.skippedIds.push(meeting.id);
+                    return;
+                }
+
+                if (exists) {
+                    result.overwritten++;
+                }
+                objectStore.put(meeting);
+                result.saved++;
+            };
+        });
+
+        transaction.oncomplete = () => {
+            resolve(result);
+        };
+
+        transaction.onerror = (event) => {
+            reject(new Error('Failed to save meetings: ' + (event.target.error ? event.target.error.message : 'Unknown error')));
+        };
+
+        transaction.onabort = () => {
+            reject(new Error('Failed to save meetings: transaction aborted'));
+        };
+    });
+}
+
 function deleteMeeting(id) {
     return getMeeting(id).then(async (meeting) => {
         if (meeting && meeting.audioFilename && isElectron()) {
@@ -329,6 +395,124 @@ function updateMeeting(id, updates) {
     });
 }
 
+// 备份整个资料库：分批读取会议记录交给主进程，主进程只写入新增或变化的会议与音频
+async function backupMeetingLibrary(onProgress) {
+    if (!isElectron()) {
+        return { success: false, error: 'Not in Electron environment' };
+    }
+
+    const beginResult = await window.electronAPI.beginLibraryBackup();
+    if (!beginResult.success) {
+        return beginResult;
+    }
+
+    let lastId = null;
+    while (true) {
+        const meetings = await getMeetingsBatch(lastId, LIBRARY_BATCH_SIZE);
+        if (meetings.length === 0) {
+            break;
+        }
+
+        const batchResult = await window.electronAPI.writeLibraryBackupBatch(meetings);
+        if (!batchResult.success) {
+            return batchResult;
+        }
+
+        lastId = meetings[meetings.length - 1].id;
+        if (typeof onProgress === 'function') {
+            onProgress(batchResult.stats);
+        }
+
+        if (meetings.length < LIBRARY_BATCH_SIZE) {
+            break;
+        }
+    }
+
+    return await window.electronAPI.finishLibraryBackup();
+}
+
+// 导入批次写入 IndexedDB 失败时删除本批次刚恢复的音频，并在错误中报告未能清理的文件
+async function discardRestoredAudio(restoredAudioPaths, error) {
+    const paths = restoredAudioPaths || [];
+    const results = await Promise.all(paths.map((filePath) => (
+        deleteAudioFile(filePath).catch((deleteError) => ({ success: false, error: deleteError.message }))
+    )));
+    const orphanedAudioPaths = paths.filter((filePath, index) => !results[index].success);
+
+    return {
+        success: false,
+        error: orphanedAudioPaths.length > 0
+            ? `${error.message} (${orphanedAudioPaths.length} restored audio files could not be removed)`
+            : error.message,
+        orphanedAudioPaths
+    };
+}
+
+// 删除被跳过的会议记录专用的音频（本批次新恢复、且没有其他已写入记录引用）
+async function discardSkippedMeetingAudio(batch, skippedIds) {
+    if (skippedIds.length === 0) {
+        return;
+    }
+
+    const skipped = new Set(skippedIds);
+    const keptAudio = new Set(batch.meetings
+        .filter((meeting) => !skipped.has(meeting.id))
+        .map((meeting) => meeting.audioFilename));
+    const unusedAudio = (batch.restoredAudioPaths || []).filter((filePath) => !keptAudio.has(filePath));
+
+    await Promise.all(unusedAudio.map((filePath) => deleteAudioFile(filePath).catch(() => null)));
+}
+
+// 从备份导入资料库：主进程逐批读取记录并恢复音频，渲染进程按批次写入 IndexedDB
+// options.overwrite 为 true 时用备份覆盖本机同 id 的会议记录，默认跳过
+async function importMeetingLibrary(onProgress, { overwrite = false } = {}) {
+    if (!isElectron()) {
+        return { success: false, error: 'Not in Electron environment' };
+    }
+
+    const beginResult = await window.electronAPI.beginLibraryImport();
+    if (!beginResult.success) {
+        return beginResult;
+    }
+
+    const totals = { imported: 0, skipped: 0, overwritten: 0 };
+    let offset = 0;
+    while (offset < beginResult.total) {
+        const batch = await window.electronAPI.readLibraryImportBatch(offset, LIBRARY_BATCH_SIZE);
+        if (!batch.success) {
+            return batch;
+        }
+
+        let saveResult;
+        try {
+            saveResult = await saveMeetingsBulk(batch.meetings, { overwrite });
+        } catch (error) {
+            return await discardRestoredAudio(batch.restoredAudioPaths, error);
+        }
+
+        await discardSkippedMeetingAudio(batch, saveResult.skippedIds);
+        totals.imported += saveResult.saved;
+        totals.skipped += saveResult.skipped;
+        totals.overwritten += saveResult.overwritten;
+
+        offset = batch.nextOffset;
+        if (typeof onProgress === 'function') {
+            onProgress({ imported: offset, total: beginResult.total });
+        }
+
+        if (batch.done) {
+            break;
+        }
+    }
+
+    const finishResult = await window.electronAPI.finishLibraryImport();
+    if (!finishResult.success) {
+        return finishResult;
+    }
+
+    return { ...finishResult, stats: { ...finishResult.stats, ...totals } };
+}
+
 // 导出
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = {
@@ -336,6 +520,8 @@ if (typeof module !== 'undefined' && module.exports) {
         saveMeeting,
         getMeeting,
         getAllMeetings,
+        getMeetingsBatch,
+        saveMeetingsBulk,
         deleteMeeting,
         saveSettings,
         getSettings,
@@ -346,6 +532,8 @@ if (typeof module !== 'undefined' && module.exports) {
         exportAudioFile,
         getAudioDirectory,
         saveConfigToFile,
-        loadConfigFromFile
+        loadConfigFromFile,
+        backupMeetingLibrary,
+        importMeetingLibrary
     };
 }
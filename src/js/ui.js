@@ -623,6 +623,7 @@ function loadSettings(settings) {
     const summaryTemplate = document.getElementById('summaryTemplate');
     const preferredMicSource = document.getElementById('preferredMicSource');
     const preferredSystemSource = document.getElementById('preferredSystemSource');
+    const linuxCaptureMode = document.getElementById('linuxCaptureMode');
 
     if (sttApiUrl && settings.sttApiUrl) sttApiUrl.value = settings.sttApiUrl;
     if (sttApiKey && settings.sttApiKey) sttApiKey.value = settings.sttApiKey;
@@ -633,6 +634,7 @@ function loadSettings(settings) {
     if (summaryTemplate && settings.summaryTemplate) summaryTemplate.value = settings.summaryTemplate;
     if (preferredMicSource && settings.preferredMicSource) preferredMicSource.value = settings.preferredMicSource;
     if (preferredSystemSource && settings.preferredSystemSource) preferredSystemSource.value = settings.preferredSystemSource;
+    if (linuxCaptureMode && settings.linuxCaptureMode) linuxCaptureMode.value = settings.linuxCaptureMode;
 }
 
 function readInputValue(id) {
@@ -666,7 +668,8 @@ function getSettingsFromUI() {
         summaryModel: readInputValue('summaryModel'),
         summaryTemplate: readInputValue('summaryTemplate'),
         preferredMicSource: document.getElementById('preferredMicSource')?.value || 'auto',
-        preferredSystemSource: document.getElementById('preferredSystemSource')?.value || 'auto'
+        preferredSystemSource: document.getElementById('preferredSystemSource')?.value || 'auto',
+        linuxCaptureMode: document.getElementById('linuxCaptureMode')?.value || 'mixed'
     };
 }
 
@@ -675,10 +678,13 @@ function renderAudioSourceOptions({
     systemSources = [],
     selectedMicSource = 'auto',
     selectedSystemSource = 'auto',
+    captureModeOptions = [],
+    selectedCaptureMode = 'mixed',
     statusText = ''
 }) {
     const micSelect = document.getElementById('preferredMicSource');
     const systemSelect = document.getElementById('preferredSystemSource');
+    const captureModeSelect = document.getElementById('linuxCaptureMode');
     const statusEl = document.getElementById('audioSourceStatus');
 
     const renderOptions = (selectEl, options, selectedValue) => {
@@ -699,6 +705,15 @@ function renderAudioSourceOptions({
     renderOptions(micSelect, microphoneSources, selectedMicSource);
     renderOptions(systemSelect, systemSources, selectedSystemSource);
 
+    // 录制模式只对 Linux FFmpeg 录制生效，其他平台隐藏
+    const captureModeField = captureModeSelect ? captureModeSelect.closest('.form-field') : null;
+    if (captureModeField) {
+        captureModeField.hidden = captureModeOptions.length === 0;
+    }
+    if (captureModeOptions.length > 0) {
+        renderOptions(captureModeSelect, captureModeOptions, selectedCaptureMode);
+    }
+
     if (statusEl) {
         statusEl.textContent = statusText;
     }
@@ -71,4 +71,6 @@ global.fetch = jest.fn();
 // 清理函数
 beforeEach(() => {
   jest.clearAllMocks();
+  // 请求耗时统计持久化在 localStorage 中，避免在测试之间互相影响
+  localStorage.removeItem('requestLatencyStats');
 });
@@ -239,6 +239,106 @@ describe('generateSummary reliability', () => {
     expect(timeoutDelays).toContain(55000);
   });
 
+  test('derives the timeout from observed latency and hedges requests slower than p95', async () => {
+    const latencyModel = require('../../src/js/latency-model');
+    const apiUrl = 'https://api.openai.com/v1/chat/completions';
+    const latencyKey = latencyModel.buildLatencyKey('summary', apiUrl, 'gpt-4');
+    const transcriptUnits = '会议转录'.length / 1000;
+
+    for (let i = 0; i < 10; i++) {
+      latencyModel.recordRequestLatency(latencyKey, transcriptUnits, 10000);
+    }
+
+    jest.useFakeTimers();
+
+    let firstSignal = null;
+    fetch
+      .mockImplementationOnce((url, options) => new Promise((resolve, reject) => {
+        firstSignal = options.signal;
+        options.signal.addEventListener('abort', () => {
+          const abortError = new Error('aborted');
+          abortError.name = 'AbortError';
+          reject(abortError);
+        });
+      }))
+      .mockResolvedValueOnce({
+        ok: true,
+        status: 200,
+        json: async () => ({
+          choices: [{
+            message: {
+              content: '对冲纪要'
+            }
+          }]
+        })
+      });
+
+    const summaryPromise = api.generateSummary('会议转录', '# 模板', apiUrl, 'test-key', 'gpt-4');
+
+    expect(setTimeout).toHaveBeenCalledWith(expect.any(Function), 30000);
+    expect(fetch).toHaveBeenCalledTimes(1);
+
+    jest.advanceTimersByTime(10000);
+
+    const result = await summaryPromise;
+
+    expect(result).toEqual({ success: true, summary: '对冲纪要' });
+    expect(fetch).toHaveBeenCalledTimes(2);
+    expect(firstSignal.aborted).toBe(true);
+  });
+
+  test('records the winning hedge attempt duration so the hedge delay does not drift upward', async () => {
+    const latencyModel = require('../../src/js/latency-model');
+    const apiUrl = 'https://api.openai.com/v1/chat/completions';
+    const latencyKey = latencyModel.buildLatencyKey('summary', apiUrl, 'gpt-4');
+    const transcriptUnits = '会议转录'.length / 1000;
+
+    for (let i = 0; i < 10; i++) {
+      latencyModel.recordRequestLatency(latencyKey, transcriptUnits, 10000);
+    }
+
+    let now = 0;
+    const dateNowSpy = jest.spyOn(Date, 'now').mockImplementation(() => now);
+    jest.useFakeTimers();
+
+    for (let i = 0; i < 5; i++) {
+      fetch
+        .mockImplementationOnce((url, options) => new Promise((resolve, reject) => {
+          options.signal.addEventListener('abort', () => {
+            const abortError = new Error('aborted');
+            abortError.name = 'AbortError';
+            reject(abortError);
+          });
+        }))
+        .mockImplementationOnce(() => {
+          now += 1000;
+          return Promise.resolve({
+            ok: true,
+            status: 200,
+            json: async () => ({
+              choices: [{
+                message: {
+                  content: '对冲纪要'
+                }
+              }]
+            })
+          });
+        });
+
+      const summaryPromise = api.generateSummary('会议转录', '# 模板', apiUrl, 'test-key', 'gpt-4');
+
+      now += 10000;
+      jest.advanceTimersByTime(10000);
+
+      await expect(summaryPromise).resolves.toEqual({ success: true, summary: '对冲纪要' });
+    }
+
+    expect(fetch).toHaveBeenCalledTimes(10);
+    expect(latencyModel.getHedgeDelay(latencyKey, transcriptUnits, 30000)).toBe(10000);
+
+    dateNowSpy.mockRestore();
+  });
+
   test('returns i18n-backed network exhausted message after retries are exhausted', async () => {
     jest.spyOn(global, 'setTimeout').mockImplementation((fn, delay, ...args) => (
       realSetTimeout(fn, 0, ...args)
@@ -1,6 +1,8 @@
 const {
   AUDIO_SOURCE_AUTO,
   AUDIO_SOURCE_UNAVAILABLE,
+  LINUX_CAPTURE_MODE_MIXED,
+  LINUX_CAPTURE_MODE_MULTITRACK,
   getDefaultAudioSourceSettings,
   resolvePreferredAudioSource,
   buildLinuxAudioSourceState
@@ -10,10 +12,18 @@ describe('Audio source settings helpers', () => {
   test('should provide default preferred source settings', () => {
     expect(getDefaultAudioSourceSettings()).toEqual({
       preferredMicSource: AUDIO_SOURCE_AUTO,
-      preferredSystemSource: AUDIO_SOURCE_AUTO
+      preferredSystemSource: AUDIO_SOURCE_AUTO,
+      linuxCaptureMode: LINUX_CAPTURE_MODE_MIXED
     });
   });
 
+  test('should keep multitrack capture mode and reset unknown modes to mixed', () => {
+    expect(getDefaultAudioSourceSettings({ linuxCaptureMode: LINUX_CAPTURE_MODE_MULTITRACK }).linuxCaptureMode)
+      .toBe(LINUX_CAPTURE_MODE_MULTITRACK);
+    expect(getDefaultAudioSourceSettings({ linuxCaptureMode: 'surround' }).linuxCaptureMode)
+      .toBe(LINUX_CAPTURE_MODE_MIXED);
+  });
+
   test('should keep preferred source when it is still available', () => {
     const selected = resolvePreferredAudioSource({
       preferredSource: 'mic-2',
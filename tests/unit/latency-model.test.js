@@ -0,0 +1,106 @@
+describe('request latency model', () => {
+  let latencyModel;
+  let storedValues;
+  let originalLocalStorageDescriptor;
+
+  function recordSamples(key, units, durations) {
+    durations.forEach((durationMs) => latencyModel.recordRequestLatency(key, units, durationMs));
+  }
+
+  beforeEach(() => {
+    jest.resetModules();
+    storedValues = {};
+    originalLocalStorageDescriptor = Object.getOwnPropertyDescriptor(window, 'localStorage');
+    Object.defineProperty(window, 'localStorage', {
+      configurable: true,
+      writable: true,
+      value: {
+        getItem: jest.fn((key) => (key in storedValues ? storedValues[key] : null)),
+        setItem: jest.fn((key, value) => {
+          storedValues[key] = String(value);
+        }),
+        removeItem: jest.fn((key) => {
+          delete storedValues[key];
+        })
+      }
+    });
+    latencyModel = require('../../src/js/latency-model');
+  });
+
+  afterEach(() => {
+    if (originalLocalStorageDescriptor) {
+      Object.defineProperty(window, 'localStorage', originalLocalStorageDescriptor);
+    }
+  });
+
+  test('builds keys per kind, endpoint and model without query strings', () => {
+    expect(latencyModel.buildLatencyKey('summary', 'https://API.openai.com/v1/chat/completions/?x=1', 'GPT-4o'))
+      .toBe('summary|https://api.openai.com/v1/chat/completions|gpt-4o');
+  });
+
+  test('falls back to the provided timeout until enough samples are observed', () => {
+    const key = latencyModel.buildLatencyKey('summary', 'https://api.openai.com/v1/chat/completions', 'gpt-4o');
+
+    recordSamples(key, 1, [4000, 4000, 4000, 4000]);
+
+    expect(latencyModel.estimateRequestLatency(key, 1)).toBeNull();
+    expect(latencyModel.getAdaptiveTimeout(key, 1, 55000)).toBe(55000);
+    expect(latencyModel.getHedgeDelay(key, 1, 55000)).toBeNull();
+  });
+
+  test('derives timeouts from observed percentiles scaled by request size', () => {
+    const key = latencyModel.buildLatencyKey('summary', 'https://api.openai.com/v1/chat/completions', 'gpt-4o');
+
+    recordSamples(key, 1, [8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 8000, 10000]);
+
+    expect(latencyModel.estimateRequestLatency(key, 1)).toBe(10000);
+    expect(latencyModel.estimateRequestLatency(key, 3)).toBe(20000);
+    expect(latencyModel.getAdaptiveTimeout(key, 1, 55000)).toBe(30000);
+    expect(latencyModel.getHedgeDelay(key, 1, 30000)).toBe(10000);
+  });
+
+  test('clamps derived timeouts to the per-kind bounds', () => {
+    const key = latencyModel.buildLatencyKey('title', 'https://api.openai.com/v1/chat/completions', 'gpt-4o-mini');
+
+    recordSamples(key, 1, [100, 100, 100, 100, 100]);
+    expect(latencyModel.getAdaptiveTimeout(key, 1, 12000)).toBe(latencyModel.LATENCY_PROFILES.title.minTimeout);
+
+    recordSamples(key, 1, [60000, 60000, 60000, 60000, 60000]);
+    expect(latencyModel.getAdaptiveTimeout(key, 1, 12000)).toBe(latencyModel.LATENCY_PROFILES.title.maxTimeout);
+  });
+
+  test('never hedges audio uploads', () => {
+    const key = latencyModel.buildLatencyKey('transcription', 'https://api.openai.com/v1/audio/transcriptions', 'whisper-1');
+
+    recordSamples(key, 10, [20000, 20000, 20000, 20000, 20000]);
+
+    expect(latencyModel.getAdaptiveTimeout(key, 10, 600000)).toBe(60000);
+    expect(latencyModel.getHedgeDelay(key, 10, 60000)).toBeNull();
+  });
+
+  test('persists samples across reloads and keeps a bounded window per key', () => {
+    const key = latencyModel.buildLatencyKey('summary', 'https://api.openai.com/v1/chat/completions', 'gpt-4o');
+
+    recordSamples(key, 1, new Array(60).fill(5000));
+
+    const persisted = JSON.parse(storedValues.requestLatencyStats);
+    expect(persisted.entries[key].samples).toHaveLength(50);
+
+    jest.resetModules();
+    const reloadedModel = require('../../src/js/latency-model');
+
+    expect(reloadedModel.estimateRequestLatency(key, 1)).toBe(5000);
+  });
+
+  test('ignores corrupted persisted stats', () => {
+    storedValues.requestLatencyStats = '{not json';
+    const warnSpy = jest.spyOn(console, 'warn').mockImplementation(() => {});
+
+    jest.resetModules();
+    const reloadedModel = require('../../src/js/latency-model');
+
+    expect(reloadedModel.estimateRequestLatency('summary|x|y', 1)).toBeNull();
+    expect(warnSpy).toHaveBeenCalled();
+    warnSpy.mockRestore();
+  });
+});
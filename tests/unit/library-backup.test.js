@@ -0,0 +1,224 @@
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const {
+  LIBRARY_MANIFEST_FILE,
+  readLibraryManifest,
+  createLibraryBackupSession,
+  backupMeetingRecord,
+  finishLibraryBackup,
+  createLibraryImportSession,
+  readLibraryImportBatch
+} = require('../../electron/library-backup');
+
+describe('library backup', () => {
+  let workDir;
+  let audioDir;
+  let backupDir;
+
+  async function runBackup(meetings) {
+    const session = createLibraryBackupSession(backupDir, audioDir);
+    for (const meeting of meetings) {
+      await backupMeetingRecord(session, meeting);
+    }
+    return finishLibraryBackup(session);
+  }
+
+  function listObjects(dirName) {
+    return fs.readdirSync(path.join(backupDir, dirName)).sort();
+  }
+
+  beforeEach(() => {
+    workDir = fs.mkdtempSync(path.join(os.tmpdir(), 'library-backup-'));
+    audioDir = path.join(workDir, 'audio_files');
+    backupDir = path.join(workDir, 'backup');
+    fs.mkdirSync(audioDir, { recursive: true });
+    fs.writeFileSync(path.join(audioDir, 'first.webm'), Buffer.alloc(4096, 1));
+    fs.writeFileSync(path.join(audioDir, 'second.webm'), Buffer.alloc(2048, 2));
+  });
+
+  afterEach(() => {
+    fs.rmSync(workDir, { recursive: true, force: true });
+  });
+
+  test('writes content-addressed meetings and audio with a manifest', async () => {
+    const stats = await runBackup([
+      { id: 'm1', date: '2026-01-01', audioFilename: path.join(audioDir, 'first.webm') },
+      { id: 'm2', date: '2026-01-02', audioFilename: 'second.webm' },
+      { id: 'm3', date: '2026-01-03' }
+    ]);
+
+    expect(stats).toEqual(expect.objectContaining({
+      meetings: 3,
+      meetingsWritten: 3,
+      audioFiles: 2,
+      audioWritten: 2
+    }));
+    expect(listObjects('meetings')).toHaveLength(3);
+    expect(listObjects('audio')).toHaveLength(2);
+
+    const manifest = readLibraryManifest(backupDir);
+    expect(Object.keys(manifest.meetings)).toEqual(['m1', 'm2', 'm3']);
+    expect(manifest.meetings.m1.audio).toEqual(expect.objectContaining({ ext: '.webm', name: 'first.webm' }));
+    expect(manifest.meetings.m3.audio).toBeNull();
+  });
+
+  test('repeat backups only write new or changed records and prune removed ones', async () => {
+    await runBackup([
+      { id: 'm1', date: '2026-01-01', audioFilename: 'first.webm' },
+      { id: 'm2', date: '2026-01-02', audioFilename: 'second.webm' }
+    ]);
+
+    const unchanged = await runBackup([
+      { id: 'm1', date: '2026-01-01', audioFilename: 'first.webm' },
+      { id: 'm2', date: '2026-01-02', audioFilename: 'second.webm' }
+    ]);
+    expect(unchanged).toEqual(expect.objectContaining({ meetingsWritten: 0, audioWritten: 0, bytesWritten: 0 }));
+
+    const changed = await runBackup([
+      { id: 'm1', date: '2026-01-01', audioFilename: 'first.webm', summary: 'edited' }
+    ]);
+    expect(changed).toEqual(expect.objectContaining({
+      meetingsWritten: 1,
+      audioWritten: 0,
+      objectsPruned: 3
+    }));
+    expect(listObjects('meetings')).toHaveLength(1);
+    expect(listObjects('audio')).toHaveLength(1);
+  });
+
+  test('re-reads audio whose size or modification time changed', async () => {
+    await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+
+    fs.writeFileSync(path.join(audioDir, 'first.webm'), Buffer.alloc(8192, 3));
+    const stats = await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+
+    expect(stats.audioWritten).toBe(1);
+    expect(stats.bytesWritten).toBe(8192);
+    expect(listObjects('audio')).toHaveLength(1);
+  });
+
+  test('records missing audio without failing the backup', async () => {
+    const stats = await runBackup([{ id: 'm1', audioFilename: 'missing.webm' }]);
+
+    expect(stats.audioMissing).toBe(1);
+    expect(readLibraryManifest(backupDir).meetings.m1.audio).toBeNull();
+  });
+
+  test('backs up records whose audio lives outside the managed audio directory without their audio', async () => {
+    const stats = await runBackup([
+      { id: 'm1', audioFilename: path.join(workDir, 'old_user_data', 'audio_files', 'first.webm') },
+      { id: 'm2', audioFilename: 'second.webm' }
+    ]);
+
+    expect(stats).toEqual(expect.objectContaining({ meetings: 2, audioSkipped: 1, audioWritten: 1 }));
+    const manifest = readLibraryManifest(backupDir);
+    expect(manifest.meetings.m1.audio).toBeNull();
+    expect(manifest.meetings.m2.audio).toEqual(expect.objectContaining({ name: 'second.webm' }));
+  });
+
+  test('imports meetings in batches and restores audio into the audio directory', async () => {
+    await runBackup([
+      { id: 'm1', audioFilename: 'first.webm' },
+      { id: 'm2', audioFilename: 'second.webm' },
+      { id: 'm3', audioFilename: 'missing.webm' }
+    ]);
+
+    const targetAudioDir = path.join(workDir, 'restored_audio');
+    const session = createLibraryImportSession(backupDir, targetAudioDir);
+
+    const firstBatch = await readLibraryImportBatch(session, 0, 2);
+    expect(firstBatch).toEqual(expect.objectContaining({ nextOffset: 2, total: 3, done: false }));
+    expect(firstBatch.meetings[0]).toEqual(expect.objectContaining({
+      id: 'm1',
+      audioFilename: path.join(targetAudioDir, 'first.webm'),
+      audioStorageStatus: 'saved'
+    }));
+    expect(fs.readFileSync(path.join(targetAudioDir, 'second.webm'))).toEqual(Buffer.alloc(2048, 2));
+    expect(firstBatch.restoredAudioPaths).toEqual([
+      path.join(targetAudioDir, 'first.webm'),
+      path.join(targetAudioDir, 'second.webm')
+    ]);
+
+    const secondBatch = await readLibraryImportBatch(session, firstBatch.nextOffset, 2);
+    expect(secondBatch.done).toBe(true);
+    expect(secondBatch.meetings[0].audioFilename).toBeUndefined();
+    expect(secondBatch.meetings[0].audioStorageStatus).toBe('failed');
+    expect(session.stats).toEqual({ meetings: 3, audioRestored: 2, audioReused: 0 });
+  });
+
+  test('does not overwrite a different local recording with the same name', async () => {
+    await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+    fs.writeFileSync(path.join(audioDir, 'first.webm'), Buffer.alloc(10, 9));
+
+    const session = createLibraryImportSession(backupDir, audioDir);
+    const { meetings } = await readLibraryImportBatch(session, 0, 10);
+
+    expect(meetings[0].audioFilename).not.toBe(path.join(audioDir, 'first.webm'));
+    expect(fs.readFileSync(path.join(audioDir, 'first.webm'))).toEqual(Buffer.alloc(10, 9));
+    expect(fs.readFileSync(meetings[0].audioFilename)).toEqual(Buffer.alloc(4096, 1));
+  });
+
+  test('reuses local audio only when its content hash matches the backup', async () => {
+    await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+
+    const identical = await readLibraryImportBatch(createLibraryImportSession(backupDir, audioDir), 0, 10);
+    expect(identical.meetings[0].audioFilename).toBe(path.join(audioDir, 'first.webm'));
+    expect(identical.restoredAudioPaths).toEqual([]);
+
+    // 同名、同大小但内容不同的本机文件，以及同样被占用的哈希前缀文件名
+    fs.writeFileSync(path.join(audioDir, 'first.webm'), Buffer.alloc(4096, 7));
+    const [hashedName] = listObjects('audio');
+    const prefixedPath = path.join(audioDir, `first_${hashedName.slice(0, 8)}.webm`);
+    fs.writeFileSync(prefixedPath, Buffer.alloc(4096, 8));
+
+    const session = createLibraryImportSession(backupDir, audioDir);
+    const { meetings, restoredAudioPaths } = await readLibraryImportBatch(session, 0, 10);
+
+    expect(meetings[0].audioFilename).toBe(path.join(audioDir, `first_${hashedName.replace('.webm', '')}.webm`));
+    expect(restoredAudioPaths).toEqual([meetings[0].audioFilename]);
+    expect(fs.readFileSync(meetings[0].audioFilename)).toEqual(Buffer.alloc(4096, 1));
+    expect(fs.readFileSync(path.join(audioDir, 'first.webm'))).toEqual(Buffer.alloc(4096, 7));
+    expect(fs.readFileSync(prefixedPath)).toEqual(Buffer.alloc(4096, 8));
+  });
+
+  test('rejects corrupted audio objects without leaving files in the audio directory', async () => {
+    await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+    const [audioObject] = listObjects('audio');
+    fs.writeFileSync(path.join(backupDir, 'audio', audioObject), Buffer.alloc(4096, 5));
+
+    const targetAudioDir = path.join(workDir, 'restored_audio');
+    const session = createLibraryImportSession(backupDir, targetAudioDir);
+
+    await expect(readLibraryImportBatch(session, 0, 10)).rejects.toThrow('Corrupted audio in backup');
+    expect(fs.readdirSync(targetAudioDir)).toEqual([]);
+  });
+
+  test('rejects manifest audio entries that point outside the backup folder', async () => {
+    await runBackup([{ id: 'm1', audioFilename: 'first.webm' }]);
+    fs.writeFileSync(path.join(workDir, 'secret.txt'), 'secret');
+
+    const manifestPath = path.join(backupDir, LIBRARY_MANIFEST_FILE);
+    const manifest = JSON.parse(fs.readFileSync(manifestPath, 'utf8'));
+    manifest.meetings.m1.audio = { hash: '../../secret', ext: '.txt', name: 'x.webm' };
+    fs.writeFileSync(manifestPath, JSON.stringify(manifest));
+
+    const targetAudioDir = path.join(workDir, 'restored_audio');
+    const session = createLibraryImportSession(backupDir, targetAudioDir);
+
+    await expect(readLibraryImportBatch(session, 0, 10)).rejects.toThrow('Invalid audio entry in backup');
+    expect(fs.existsSync(path.join(targetAudioDir, 'x.webm'))).toBe(false);
+  });
+
+  test('rejects corrupted meeting records and unknown manifests', async () => {
+    await runBackup([{ id: 'm1' }]);
+    const [meetingFile] = listObjects('meetings');
+    fs.writeFileSync(path.join(backupDir, 'meetings', meetingFile), '{"id":"tampered"}');
+
+    const session = createLibraryImportSession(backupDir, audioDir);
+    await expect(readLibraryImportBatch(session, 0, 10)).rejects.toThrow('Corrupted meeting record');
+
+    fs.writeFileSync(path.join(backupDir, LIBRARY_MANIFEST_FILE), JSON.stringify({ format: 'other' }));
+    expect(() => createLibraryImportSession(backupDir, audioDir)).toThrow('Not a meeting library backup');
+  });
+});
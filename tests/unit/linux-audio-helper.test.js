@@ -4,7 +4,14 @@ const {
   resetDependencyCheck,
   parsePulseSourceList,
   chooseRecordingSources,
-  getAlsaSourceLoadCandidates
+  getAlsaSourceLoadCandidates,
+  LINUX_CAPTURE_MODE_MIXED,
+  LINUX_CAPTURE_MODE_MULTITRACK,
+  buildFfmpegCaptureArgs,
+  parseTrackRmsLevels,
+  getActiveTrackIndexes,
+  parseAudioStreamCount,
+  buildDeferredMixArgs
 } = require('../../electron/linux-audio-helper');
 
 describe('Linux 音频系统检测', () => {
@@ -278,4 +285,117 @@ describe('Linux 音频系统检测', () => {
       ]);
     });
   });
+
+  describe('buildFfmpegCaptureArgs', () => {
+    const devices = {
+      outputPath: '/tmp/rec.webm',
+      microphoneDevice: 'alsa_input.mic',
+      monitorDevice: 'alsa_output.speaker.monitor'
+    };
+
+    it('默认模式应实时混音并编码为单音轨', () => {
+      const { captureMode, args } = buildFfmpegCaptureArgs(devices);
+
+      expect(captureMode).toBe(LINUX_CAPTURE_MODE_MIXED);
+      expect(args.join(' ')).toContain('amix=inputs=2');
+      expect(args[args.length - 1]).toBe('/tmp/rec.webm');
+    });
+
+    it('分轨模式应分别写入两条音轨且录制时不混音', () => {
+      const { captureMode, args } = buildFfmpegCaptureArgs({
+        ...devices,
+        captureMode: LINUX_CAPTURE_MODE_MULTITRACK
+      });
+      const commandLine = args.join(' ');
+
+      expect(captureMode).toBe(LINUX_CAPTURE_MODE_MULTITRACK);
+      expect(commandLine).not.toContain('amix');
+      expect(commandLine).toContain('-map 0:a -map 1:a');
+      expect(commandLine).toContain('-f matroska -y /tmp/rec.webm');
+      expect(commandLine).toContain('sample_rates=8000');
+      expect(commandLine).toContain('-map [levels] -f null -');
+    });
+
+    it('分轨模式下只有一个输入源时应回退到单路录制', () => {
+      const { captureMode, args } = buildFfmpegCaptureArgs({
+        outputPath: '/tmp/rec.webm',
+        microphoneDevice: 'alsa_input.mic',
+        monitorDevice: null,
+        captureMode: LINUX_CAPTURE_MODE_MULTITRACK
+      });
+
+      expect(captureMode).toBe(LINUX_CAPTURE_MODE_MIXED);
+      expect(args).toEqual(expect.arrayContaining(['-i', 'alsa_input.mic', '-ac', '1']));
+    });
+
+    it('没有任何输入源时应报错', () => {
+      expect(() => buildFfmpegCaptureArgs({ outputPath: '/tmp/rec.webm' })).toThrow('PulseAudio');
+    });
+  });
+
+  describe('parseTrackRmsLevels', () => {
+    it('应按声道解析 astats 电平', () => {
+      const message = [
+        'frame:10 pts:1280 pts_time:0.16',
+        'lavfi.astats.1.RMS_level=-32.5',
+        'lavfi.astats.2.RMS_level=-inf',
+        'lavfi.astats.Overall.RMS_level=-35.1'
+      ].join('\n');
+
+      expect(parseTrackRmsLevels(message)[0]).toBe(-32.5);
+      expect(parseTrackRmsLevels(message)[1]).toBeUndefined();
+      expect(parseTrackRmsLevels('no levels here')).toEqual([]);
+    });
+  });
+
+  describe('buildDeferredMixArgs', () => {
+    it('两条音轨都有声音时应混音', () => {
+      const args = buildDeferredMixArgs({
+        inputPath: '/tmp/rec.webm',
+        outputPath: '/tmp/rec.webm.mixed.webm',
+        trackPeakRms: [-20, -25]
+      });
+
+      expect(args.join(' ')).toContain('[0:a:0][0:a:1]amix=inputs=2');
+    });
+
+    it('只有一条音轨有声音时应直接复制该音轨而不重新编码', () => {
+      const args = buildDeferredMixArgs({
+        inputPath: '/tmp/rec.webm',
+        outputPath: '/tmp/rec.webm.mixed.webm',
+        trackPeakRms: [-80, -18]
+      });
+
+      expect(args).toEqual(expect.arrayContaining(['-map', '0:a:1', '-c:a', 'copy']));
+      expect(args.join(' ')).not.toContain('amix');
+    });
+
+    it('输入只剩一条音轨时应直接复制该音轨', () => {
+      const probeOutput = [
+        "Input #0, matroska,webm, from '/tmp/rec.webm':",
+        '  Stream #0:0: Audio: opus, 48000 Hz, stereo, fltp (default)'
+      ].join('\n');
+
+      expect(parseAudioStreamCount(probeOutput)).toBe(1);
+      expect(parseAudioStreamCount([
+        '  Stream #0:0: Audio: opus, 48000 Hz, mono, fltp (default)',
+        '  Stream #0:1: Audio: opus, 48000 Hz, stereo, fltp'
+      ].join('\n'))).toBe(2);
+
+      const args = buildDeferredMixArgs({
+        inputPath: '/tmp/rec.webm',
+        outputPath: '/tmp/rec.webm.mixed.webm',
+        trackPeakRms: [-20, -25],
+        audioStreamCount: 1
+      });
+
+      expect(args).toEqual(expect.arrayContaining(['-map', '0:a:0', '-c:a', 'copy']));
+      expect(args.join(' ')).not.toContain('amix');
+    });
+
+    it('电平未知时应保守地混合两条音轨', () => {
+      expect(getActiveTrackIndexes(null)).toEqual([0, 1]);
+      expect(getActiveTrackIndexes([-90])).toEqual([]);
+    });
+  });
 });
@@ -30,7 +30,9 @@ describe('Main process IPC handler validation', () => {
       checkLinuxDependencies: jest.fn(),
       parsePulseSourceList: jest.fn(() => []),
       chooseRecordingSources: jest.fn(() => ({})),
-      getAlsaSourceLoadCandidates: jest.fn(() => [])
+      getAlsaSourceLoadCandidates: jest.fn(() => []),
+      parseAudioStreamCount: jest.fn(() => 2),
+      buildDeferredMixArgs: jest.fn(({ inputPath, outputPath }) => ['-i', inputPath, outputPath])
     }));
     jest.doMock('electron', () => {
       const browserWindowInstance = {
@@ -102,4 +104,64 @@ describe('Main process IPC handler validation', () => {
     });
     expect(fsMock.unlinkSync).not.toHaveBeenCalled();
   });
+
+  test('mix-multitrack-audio should remove the partial mix when ffmpeg fails', async () => {
+    fsMock.promises = {
+      access: jest.fn().mockResolvedValue(),
+      rename: jest.fn().mockResolvedValue(),
+      rm: jest.fn().mockResolvedValue()
+    };
+    require('child_process').spawn.mockImplementation(() => ({
+      stderr: { on: jest.fn((eventName, callback) => callback(Buffer.from('mix failed'))) },
+      on: jest.fn((eventName, callback) => {
+        if (eventName === 'close') {
+          callback(1);
+        }
+      })
+    }));
+
+    const result = await handlers['mix-multitrack-audio']({}, { filePath: '/mock/userData/audio_files/recording.webm' });
+
+    expect(result).toEqual({ success: false, error: 'mix failed' });
+    expect(fsMock.promises.rename).not.toHaveBeenCalled();
+    expect(fsMock.promises.rm).toHaveBeenCalledWith('/mock/userData/audio_files/recording.webm.mixed.webm', { force: true });
+  });
+
+  test('mix-multitrack-audio should copy the only track when the file was already mixed', async () => {
+    fsMock.promises = {
+      access: jest.fn().mockResolvedValue(),
+      rename: jest.fn().mockResolvedValue(),
+      rm: jest.fn().mockResolvedValue()
+    };
+    const linuxAudioHelper = require('../../electron/linux-audio-helper');
+    linuxAudioHelper.parseAudioStreamCount.mockReturnValue(1);
+    require('child_process').spawn.mockImplementation(() => ({
+      stderr: { on: jest.fn() },
+      on: jest.fn((eventName, callback) => {
+        if (eventName === 'close') {
+          callback(0);
+        }
+      })
+    }));
+
+    const result = await handlers['mix-multitrack-audio']({}, { filePath: '/mock/userData/audio_files/recording.webm' });
+
+    expect(result).toEqual({ success: true, filePath: '/mock/userData/audio_files/recording.webm' });
+    expect(linuxAudioHelper.buildDeferredMixArgs).toHaveBeenCalledWith(expect.objectContaining({
+      inputPath: '/mock/userData/audio_files/recording.webm',
+      audioStreamCount: 1
+    }));
+  });
+
+  test('library backup and import handlers should require an active session', async () => {
+    await expect(handlers['write-library-backup-batch']({}, { meetings: [{ id: 'm1' }] })).resolves.toEqual({
+      success: false,
+      error: 'No library backup in progress'
+    });
+    await expect(handlers['read-library-import-batch']({}, { offset: 0, count: 10 })).resolves.toEqual({
+      success: false,
+      error: 'No library import in progress'
+    });
+    expect(fsMock.writeFileSync).not.toHaveBeenCalled();
+  });
 });
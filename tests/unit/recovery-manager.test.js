@@ -526,3 +526,35 @@ describe('Recovery Manager 模块测试', () => {
     });
   });
 });
+
+describe('recoverAudioBlob 分轨临时文件', () => {
+  beforeEach(() => {
+    jest.resetModules();
+    global.window.electronAPI = {
+      writeRecoveryMeta: jest.fn().mockResolvedValue({ success: true }),
+      readAudioFile: jest.fn().mockResolvedValue({ success: true, data: new Uint8Array([1, 2, 3]) }),
+      mixMultitrackAudio: jest.fn()
+    };
+  });
+
+  it('混音失败时应退回只复制第一条音轨，而不是丢弃整段录音', async () => {
+    const { recoverAudioBlob } = require('../../src/js/recovery-manager');
+    const meta = {
+      id: '123456',
+      isLinux: true,
+      captureMode: 'multitrack',
+      tempFile: '/audio/temp_recording_123456.webm'
+    };
+    window.electronAPI.mixMultitrackAudio
+      .mockResolvedValueOnce({ success: false, error: 'amix failed' })
+      .mockResolvedValueOnce({ success: true, filePath: meta.tempFile });
+
+    const blob = await recoverAudioBlob(meta);
+
+    expect(blob).not.toBeNull();
+    expect(window.electronAPI.mixMultitrackAudio).toHaveBeenNthCalledWith(1, meta.tempFile, null);
+    expect(window.electronAPI.mixMultitrackAudio).toHaveBeenNthCalledWith(2, meta.tempFile, [0, null]);
+    expect(window.electronAPI.writeRecoveryMeta).toHaveBeenCalledWith(expect.objectContaining({ captureMode: 'mixed' }));
+    expect(window.electronAPI.readAudioFile).toHaveBeenCalledWith(meta.tempFile);
+  });
+});
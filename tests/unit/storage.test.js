@@ -468,4 +468,176 @@ describe('Storage 模块测试', () => {
       expect(result.audioStorageError).toBeUndefined();
     });
   });
+
+  describe('资料库备份与导入', () => {
+    async function initStorageWithDb(mockDb) {
+      const storage = require('../../src/js/storage');
+      const initPromise = storage.initDB();
+      const mockOpenRequest = indexedDB.open.mock.results[0].value;
+      mockOpenRequest.onsuccess({ target: { result: mockDb } });
+      await initPromise;
+      return storage;
+    }
+
+    function createBulkStore(existingIds) {
+      const mockObjectStore = {
+        getKey: jest.fn((id) => {
+          const request = {};
+          setTimeout(() => {
+            request.result = existingIds.includes(id) ? id : undefined;
+            request.onsuccess();
+          }, 0);
+          return request;
+        }),
+        put: jest.fn()
+      };
+      const mockTransaction = {
+        objectStore: jest.fn().mockReturnValue(mockObjectStore)
+      };
+      const mockDb = {
+        transaction: jest.fn().mockReturnValue(mockTransaction)
+      };
+
+      return { mockObjectStore, mockTransaction, mockDb };
+    }
+
+    test('saveMeetingsBulk 应在单个事务中写入整批会议记录并默认跳过本机已有的记录', async () => {
+      const { mockObjectStore, mockTransaction, mockDb } = createBulkStore(['m2']);
+
+      const storage = await initStorageWithDb(mockDb);
+      const meetings = [{ id: 'm1' }, { id: 'm2' }, { id: 'm3' }];
+      const savePromise = storage.saveMeetingsBulk(meetings);
+
+      await new Promise(resolve => setTimeout(resolve, 0));
+      mockTransaction.oncomplete();
+
+      await expect(savePromise).resolves.toEqual({ saved: 2, skipped: 1, overwritten: 0, skippedIds: ['m2'] });
+      expect(mockDb.transaction).toHaveBeenCalledTimes(1);
+      expect(mockDb.transaction).toHaveBeenCalledWith(['meetings'], 'readwrite');
+      expect(mockObjectStore.put).toHaveBeenCalledTimes(2);
+      expect(mockObjectStore.put).not.toHaveBeenCalledWith({ id: 'm2' });
+    });
+
+    test('saveMeetingsBulk 在 overwrite 为 true 时应覆盖本机已有的记录', async () => {
+      const { mockObjectStore, mockTransaction, mockDb } = createBulkStore(['m2']);
+
+      const storage = await initStorageWithDb(mockDb);
+      const savePromise = storage.saveMeetingsBulk([{ id: 'm1' }, { id: 'm2' }], { overwrite: true });
+
+      await new Promise(resolve => setTimeout(resolve, 0));
+      mockTransaction.oncomplete();
+
+      await expect(savePromise).resolves.toEqual({ saved: 2, skipped: 0, overwritten: 1, skippedIds: [] });
+      expect(mockObjectStore.put).toHaveBeenCalledWith({ id: 'm2' });
+    });
+
+    test('importMeetingLibrary 应删除被跳过记录专用的已恢复音频并汇总统计', async () => {
+      const { mockTransaction, mockDb } = createBulkStore(['m2']);
+      window.electronAPI.beginLibraryImport = jest.fn().mockResolvedValue({ success: true, total: 2 });
+      window.electronAPI.readLibraryImportBatch = jest.fn().mockResolvedValue({
+        success: true,
+        meetings: [
+          { id: 'm1', audioFilename: '/audio/m1.webm' },
+          { id: 'm2', audioFilename: '/audio/m2_1a2b3c4d.webm' }
+        ],
+        restoredAudioPaths: ['/audio/m1.webm', '/audio/m2_1a2b3c4d.webm'],
+        nextOffset: 2,
+        done: true
+      });
+      window.electronAPI.finishLibraryImport = jest.fn().mockResolvedValue({
+        success: true,
+        stats: { meetings: 2, audioRestored: 2, audioReused: 0 }
+      });
+      window.electronAPI.deleteAudio.mockResolvedValue({ success: true });
+
+      const storage = await initStorageWithDb(mockDb);
+      const importPromise = storage.importMeetingLibrary();
+
+      await new Promise(resolve => setTimeout(resolve, 10));
+      mockTransaction.oncomplete();
+
+      const result = await importPromise;
+
+      expect(window.electronAPI.deleteAudio).toHaveBeenCalledTimes(1);
+      expect(window.electronAPI.deleteAudio).toHaveBeenCalledWith('/audio/m2_1a2b3c4d.webm');
+      expect(result).toEqual({
+        success: true,
+        stats: { meetings: 2, audioRestored: 2, audioReused: 0, imported: 1, skipped: 1, overwritten: 0 }
+      });
+    });
+
+    test('backupMeetingLibrary 应按主键分批读取并发送给主进程', async () => {
+      const firstBatch = Array.from({ length: 100 }, (_, index) => ({ id: `m${String(index).padStart(3, '0')}` }));
+      const secondBatch = [{ id: 'm100' }];
+      const batches = [firstBatch, secondBatch];
+      const mockObjectStore = {
+        getAll: jest.fn(() => {
+          const request = { result: batches.shift() };
+          setTimeout(() => request.onsuccess(), 0);
+          return request;
+        })
+      };
+      const mockDb = {
+        transaction: jest.fn().mockReturnValue({
+          objectStore: jest.fn().mockReturnValue(mockObjectStore)
+        })
+      };
+      global.IDBKeyRange = {
+        lowerBound: jest.fn((value, open) => ({ lower: value, lowerOpen: open }))
+      };
+      window.electronAPI.beginLibraryBackup = jest.fn().mockResolvedValue({ success: true, backupDir: '/backup' });
+      window.electronAPI.writeLibraryBackupBatch = jest.fn().mockResolvedValue({ success: true, stats: {} });
+      window.electronAPI.finishLibraryBackup = jest.fn().mockResolvedValue({ success: true, stats: { meetings: 101 } });
+
+      const storage = await initStorageWithDb(mockDb);
+      const result = await storage.backupMeetingLibrary();
+
+      expect(result).toEqual({ success: true, stats: { meetings: 101 } });
+      expect(mockObjectStore.getAll).toHaveBeenNthCalledWith(1, null, 100);
+      expect(mockObjectStore.getAll).toHaveBeenNthCalledWith(2, { lower: 'm099', lowerOpen: true }, 100);
+      expect(window.electronAPI.writeLibraryBackupBatch).toHaveBeenNthCalledWith(1, firstBatch);
+      expect(window.electronAPI.writeLibraryBackupBatch).toHaveBeenNthCalledWith(2, secondBatch);
+      expect(window.electronAPI.finishLibraryBackup).toHaveBeenCalledTimes(1);
+
+      delete global.IDBKeyRange;
+    });
+
+    test('importMeetingLibrary 写入失败时应删除本批次恢复的音频并返回错误', async () => {
+      const mockTransaction = {
+        objectStore: jest.fn().mockReturnValue({ getKey: jest.fn(() => ({})), put: jest.fn() })
+      };
+      const mockDb = {
+        transaction: jest.fn().mockReturnValue(mockTransaction)
+      };
+      window.electronAPI.beginLibraryImport = jest.fn().mockResolvedValue({ success: true, total: 2 });
+      window.electronAPI.readLibraryImportBatch = jest.fn().mockResolvedValue({
+        success: true,
+        meetings: [{ id: 'm1' }, { id: 'm2' }],
+        restoredAudioPaths: ['/audio/m1.webm', '/audio/m2.webm'],
+        nextOffset: 2,
+        done: true
+      });
+      window.electronAPI.finishLibraryImport = jest.fn();
+      window.electronAPI.deleteAudio
+        .mockResolvedValueOnce({ success: true })
+        .mockResolvedValueOnce({ success: false, error: 'Permission denied' });
+
+      const storage = await initStorageWithDb(mockDb);
+      const importPromise = storage.importMeetingLibrary();
+
+      await new Promise(resolve => setTimeout(resolve, 0));
+      mockTransaction.onerror({ target: { error: new Error('Quota exceeded') } });
+
+      const result = await importPromise;
+
+      expect(window.electronAPI.deleteAudio).toHaveBeenCalledWith('/audio/m1.webm');
+      expect(window.electronAPI.deleteAudio).toHaveBeenCalledWith('/audio/m2.webm');
+      expect(window.electronAPI.finishLibraryImport).not.toHaveBeenCalled();
+      expect(result).toEqual({
+        success: false,
+        error: 'Failed to save meetings: Quota exceeded (1 restored audio files could not be removed)',
+        orphanedAudioPaths: ['/audio/m2.webm']
+      });
+    });
+  });
 });
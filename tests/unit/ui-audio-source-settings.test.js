@@ -79,6 +79,41 @@ describe('UI audio source settings', () => {
     expect(() => getSettingsFromUI()).toThrow('STT API URL');
   });
 
+  test('should render the Linux capture mode only when options are provided', () => {
+    document.body.insertAdjacentHTML('beforeend', `
+      <div class="form-field" id="captureModeField">
+        <select id="linuxCaptureMode"></select>
+      </div>
+    `);
+
+    const captureModeOptions = [
+      { id: 'mixed', label: '实时混音（默认）' },
+      { id: 'multitrack', label: '分轨录制' }
+    ];
+
+    renderAudioSourceOptions({
+      microphoneSources: [{ id: 'auto', label: '自动选择（推荐）' }],
+      systemSources: [{ id: 'auto', label: '自动选择（推荐）' }],
+      captureModeOptions,
+      selectedCaptureMode: 'multitrack'
+    });
+
+    expect(document.getElementById('captureModeField').hidden).toBe(false);
+    expect(document.getElementById('linuxCaptureMode').value).toBe('multitrack');
+
+    document.getElementById('sttApiUrl').value = '';
+    expect(getSettingsFromUI().linuxCaptureMode).toBe('multitrack');
+
+    renderAudioSourceOptions({
+      microphoneSources: [{ id: 'auto', label: '自动选择（推荐）' }],
+      systemSources: [{ id: 'auto', label: '自动选择（推荐）' }]
+    });
+
+    expect(document.getElementById('captureModeField').hidden).toBe(true);
+
+    document.getElementById('captureModeField').remove();
+  });
+
   test('should open custom dropdown and close it after selecting an option', () => {
     document.body.innerHTML = `
       <div class="custom-select" id="selectField" data-custom-select="preferredMicSource">